@@ -0,0 +1,14 @@
+import pandas as pd
+
+# Same bucket starts as Snowflake's DATE_TRUNC with the default WEEK_START (weeks begin on Monday).
+_PERIODS = {"day": "D", "week": "W-SUN", "month": "M"}
+
+
+def truncate(dates, timeframe):
+    dates = pd.to_datetime(dates)
+    return dates.dt.to_period(_PERIODS[timeframe]).dt.start_time
+
+
+def round_sum(values):
+    # ROUND(SUM(x)) semantics: NULL when every value is NULL.
+    return round(values.sum()) if values.notna().any() else None
@@ -0,0 +1,82 @@
+import threading
+
+from axelar_dashboard import mirror, staging
+from axelar_dashboard.connection import ConnectionPool, read_frame
+from axelar_dashboard.profiling import annotate
+from axelar_dashboard.shared_cache import get_shared_cache
+from axelar_dashboard.store import DailyStore
+
+
+class SnowflakeBackend:
+    """The warehouse itself: serves every range, and reads staging tables when they are fresh.
+
+    Results go through the shared cache when one is configured, so replicas reuse each other's queries.
+    """
+
+    name = "snowflake"
+
+    def covers(self, start_date, end_date):
+        return True
+
+    def dataset(self, name):
+        return name
+
+    def facts_for(self, spec, start_date, end_date):
+        return staging.facts_for(spec, start_date, end_date)
+
+    def read_frame(self, query, params=None, categories=()):
+        annotate(backend=self.name)
+        return read_frame(query, params, categories, cache=get_shared_cache())
+
+
+class MirrorBackend:
+    """DuckDB over the local Parquet mirror (see mirror.py), for closed ranges it holds in full.
+
+    Its user sketches are built locally and do not merge with Snowflake's, so its
+    daily aggregates are stored under their own dataset names.
+    """
+
+    name = "mirror"
+
+    def __init__(self, root, max_size=4):
+        from axelar_dashboard.localdb import DuckDBConnection  # duckdb is only needed once a mirror is configured
+
+        self.store = DailyStore(root)
+        self.pool = ConnectionPool(
+            lambda: DuckDBConnection(":memory:", read_only=False, setup=mirror.view_statements(root)),
+            max_size=max_size,
+        )
+
+    def covers(self, start_date, end_date):
+        return mirror.covers(self.store, start_date, end_date)
+
+    def dataset(self, name):
+        return f"{name}@{self.name}"
+
+    def facts_for(self, spec, start_date, end_date):
+        return None
+
+    def read_frame(self, query, params=None, categories=()):
+        annotate(backend=self.name)
+        return read_frame(query, params, categories, pool=self.pool)
+
+
+# --- Selection -------------------------------------------------------------------------------------------------------------------
+_backends = None
+_backends_lock = threading.Lock()
+
+
+def get_backends():
+    """Backends in order of preference; Snowflake comes last and covers everything."""
+    global _backends
+    if _backends is None:
+        with _backends_lock:
+            if _backends is None:
+                root = mirror.mirror_root()
+                _backends = ([MirrorBackend(root)] if root else []) + [SnowflakeBackend()]
+    return _backends
+
+
+def backend_for(start_date, end_date):
+    """The first backend that can serve the whole of [start_date, end_date]."""
+    return next(backend for backend in get_backends() if backend.covers(start_date, end_date))
@@ -0,0 +1,290 @@
+"""Offline benchmark over a synthetic local warehouse.
+
+    python -m axelar_dashboard.benchmark --scale 1 --repeat 3
+
+Builds DuckDB copies of fact_transactions, fact_transfers, fact_gmp and
+EZ_BRIDGE_SATELLITE (nested ``data`` JSON included) in ``<workdir>/axelar.duckdb``,
+points the connection pool at it and times every loader and a full render of
+Main_Dashboard.py under ``AppTest``, cold (empty range cache and day store) and
+warm.  Each case reports median wall time, peak traced Python memory (numpy
+and pandas buffers included, Arrow buffers not) and the number of warehouse
+queries.  Results are written to ``<workdir>/results/`` and compared with the
+previous run there, or with ``--compare``.  Needs ``duckdb``, which the
+dashboard itself only uses when a local mirror is configured.
+
+The render uses the script's default date range, so keep it inside
+``--start``/``--end``.
+"""
+import argparse
+import json
+import logging
+import os
+import shutil
+import statistics
+import subprocess
+import time
+import tracemalloc
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+import duckdb
+
+from axelar_dashboard import cache, connection, core, cube, satellite, squid, store
+from axelar_dashboard.localdb import DuckDBConnection, queries_executed
+from axelar_dashboard.queries import SQUID_CONTRACTS
+
+SCRIPT = Path(__file__).resolve().parent.parent / "Main_Dashboard.py"
+
+# Rows per day at --scale 1.
+ROWS_PER_DAY = {"fact_transactions": 4000, "fact_transfers": 600, "fact_gmp": 400, "ez_bridge_satellite": 150}
+
+CHAINS = (
+    "ethereum", "arbitrum", "base", "polygon", "avalanche", "binance", "optimism", "osmosis",
+    "celo", "fantom", "moonbeam", "kava", "axelarnet", "scroll", "linea", "Ethereum", "Polygon",
+)
+SATELLITE_SOURCES = ("ethereum", "bsc", "polygon", "arbitrum", "avalanche")
+
+
+# --- Synthetic Warehouse ---------------------------------------------------------------------------------------------------------
+def _list(values):
+    return "[" + ", ".join(f"'{value}'" for value in values) + "]"
+
+
+def _pick(values, seed):
+    # Deterministic pick from a list literal (DuckDB lists are 1-based).
+    return f"{_list(values)}[1 + (hash({seed}) % {len(values)})::BIGINT]"
+
+
+def _timestamp(start, seconds, seed):
+    return f"TIMESTAMP '{start}' + to_seconds(CAST(hash({seed}) % {seconds} AS BIGINT))"
+
+
+def build_warehouse(path, start, end, scale=1.0):
+    """(Re)create the four source tables over [start, end] and return their row counts."""
+    days = (end - start).days + 1
+    seconds = days * 86400
+    n = {table: max(1, int(per_day * days * scale)) for table, per_day in ROWS_PER_DAY.items()}
+    users = max(10, n["fact_transactions"] // 20)
+    squid = _list(SQUID_CONTRACTS)
+
+    if os.path.exists(path):
+        os.remove(path)
+    with duckdb.connect(str(path)) as db:
+        for schema in ("core", "axelscan", "defi"):
+            db.execute(f"CREATE SCHEMA {schema}")
+
+        db.execute(f"""
+            CREATE TABLE core.fact_transactions AS
+            SELECT {_timestamp(start, seconds, "i")} AS block_timestamp,
+                   md5('tx' || i) AS tx_id,
+                   'axelar1' || hash(i, 'user') % {users} AS tx_from,
+                   hash(i, 'ok') % 100 < 97 AS tx_succeeded
+            FROM range({n["fact_transactions"]}) t(i)
+        """)
+
+        # One in four transfers goes through a Squid contract, written in mixed case like the chain data.
+        db.execute(f"""
+            CREATE TABLE axelscan.fact_transfers AS
+            SELECT {_timestamp(start, seconds, "i, 'transfer'")} AS created_at,
+                   md5('t' || i) || '_' || i % 3 AS id,
+                   CASE WHEN hash(i, 'status') % 20 = 0 THEN 'failed' ELSE 'executed' END AS status,
+                   CASE WHEN hash(i, 'simple') % 25 = 0 THEN 'sent' ELSE 'received' END AS simplified_status,
+                   CASE WHEN hash(i, 'squid') % 4 = 0 THEN upper({squid}[1 + (hash(i) % {len(SQUID_CONTRACTS)})::BIGINT])
+                        ELSE '0x' || md5('sender' || i % 5000) END AS sender_address,
+                   '0x' || md5('recipient' || hash(i, 'user') % {users}) AS recipient_address,
+                   json_object(
+                       'send', json_object(
+                           'original_source_chain', {_pick(CHAINS, "i, 'src'")},
+                           'original_destination_chain', {_pick(CHAINS, "i, 'dst'")},
+                           'amount', CASE WHEN i % 2 = 0 THEN (hash(i, 'amount') % 100000 / 100.0)::VARCHAR
+                                          ELSE to_json(hash(i, 'amount') % 100000 / 100.0) END,
+                           'fee_value', hash(i, 'fee') % 1000 / 1000.0),
+                       'link', CASE WHEN hash(i, 'priced') % 10 = 0 THEN json_object()
+                                    ELSE json_object('price', 0.5 + hash(i, 'price') % 400 / 100.0) END
+                   ) AS data
+            FROM range({n["fact_transfers"]}) t(i)
+        """)
+
+        db.execute(f"""
+            CREATE TABLE axelscan.fact_gmp AS
+            SELECT {_timestamp(start, seconds, "i, 'gmp'")} AS created_at,
+                   md5('g' || i) || '_' || i % 2 AS id,
+                   CASE WHEN hash(i, 'status') % 20 = 0 THEN 'error' ELSE 'executed' END AS status,
+                   'received' AS simplified_status,
+                   json_object(
+                       'call', json_object(
+                           'chain', {_pick(CHAINS, "i, 'src'")},
+                           'returnValues', json_object('destinationChain', {_pick(CHAINS, "i, 'dst'")}),
+                           'transaction', json_object('from', '0x' || md5('recipient' || hash(i, 'user') % {users}))),
+                       'value', hash(i, 'value') % 500000 / 100.0,
+                       'gas', json_object('gas_used_amount', hash(i, 'gas') % 1000 / 10000.0),
+                       'gas_price_rate', json_object('source_token', json_object('token_price', json_object('usd', 1.5))),
+                       'fees', json_object('express_fee_usd', 0.1),
+                       'approved', json_object('returnValues', json_object('contractAddress',
+                           CASE WHEN hash(i, 'squid') % 3 = 0 THEN {squid}[1 + (hash(i) % {len(SQUID_CONTRACTS)})::BIGINT]
+                                ELSE '0x' || md5('contract' || i % 100) END))
+                   ) AS data
+            FROM range({n["fact_gmp"]}) t(i)
+        """)
+
+        # Most satellite rows share a tx hash with a transfer, so the USD join finds a price.
+        db.execute(f"""
+            CREATE TABLE defi.ez_bridge_satellite AS
+            SELECT {_timestamp(start, seconds, "i, 'satellite'")} AS block_timestamp,
+                   md5('t' || hash(i, 'match') % {int(n["fact_transfers"] * 1.3)}) AS tx_hash,
+                   {_pick(SATELLITE_SOURCES, "i, 'src'")} AS source_chain,
+                   {_pick(CHAINS, "i, 'dst'")} AS destination_chain,
+                   '0x' || md5('satellite' || hash(i, 'user') % {max(10, users // 10)}) AS sender
+            FROM range({n["ez_bridge_satellite"]}) t(i)
+        """)
+    return n
+
+
+# --- Measurement -----------------------------------------------------------------------------------------------------------------
+def reset_caches():
+    """Empty the in-process range cache, the chain-pair cubes and the on-disk day store."""
+    cache._cache.clear()
+    cube._cubes.clear()
+    root = store.get_store().root
+    if os.path.isdir(root):
+        shutil.rmtree(root)
+
+
+def _timed(fn):
+    before = queries_executed()
+    started = time.perf_counter()
+    fn()
+    return (time.perf_counter() - started) * 1000, queries_executed() - before
+
+
+def _traced(fn):
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+
+def measure(fn, repeat):
+    """Median cold and warm wall time, query counts and peak memory of ``fn``."""
+    cold, warm = [], []
+    for _ in range(repeat):
+        reset_caches()
+        cold.append(_timed(fn))
+        warm.append(_timed(fn))
+    # tracemalloc slows everything down, so memory gets its own pass.
+    reset_caches()
+    cold_peak = _traced(fn)
+    warm_peak = _traced(fn)
+    return {
+        "cold_ms": round(statistics.median(ms for ms, _ in cold), 1),
+        "warm_ms": round(statistics.median(ms for ms, _ in warm), 1),
+        "cold_queries": cold[-1][1],
+        "warm_queries": warm[-1][1],
+        "cold_peak_mib": round(cold_peak, 2),
+        "warm_peak_mib": round(warm_peak, 2),
+    }
+
+
+def render():
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(SCRIPT), default_timeout=600)
+    # Squid and Satellite start collapsed; open them so every section loads and draws, as in runs before that.
+    at.session_state["squid_open"] = at.session_state["satellite_open"] = True
+    at.run()
+    problems = [e.value for e in at.exception] + [e.value for e in at.error]
+    if problems:
+        raise RuntimeError(f"Render failed: {problems}")
+
+
+# --- Results ---------------------------------------------------------------------------------------------------------------------
+def _commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=SCRIPT.parent, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def save(results, directory):
+    directory.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    path = directory / f"{stamp}-{results['commit'] or 'nogit'}.json"
+    path.write_text(json.dumps(results, indent=2))
+    return path
+
+
+def report(results, baseline=None):
+    print(f"commit {results['commit']}  scale {results['params']['scale']}  rows {results['rows']}")
+    if baseline:
+        print(f"compared with {baseline['commit']} ({baseline['params']})")
+    print(f"{'case':<12}{'metric':<16}{'value':>12}{'baseline':>12}{'change':>10}")
+    for case, metrics in results["cases"].items():
+        for metric, value in metrics.items():
+            old = (baseline or {}).get("cases", {}).get(case, {}).get(metric)
+            change = f"{(value - old) / old:+.0%}" if old else ""
+            print(f"{case:<12}{metric:<16}{value:>12}{'' if old is None else old:>12}{change:>10}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the dashboard against a synthetic local warehouse.")
+    parser.add_argument("--workdir", default=".cache/benchmark", help="Where the warehouse, store and results live")
+    parser.add_argument("--start", default="2025-01-01", help="First day of synthetic data")
+    parser.add_argument("--end", default="2025-08-31", help="Last day of synthetic data")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiplier on the default rows per day")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case; the median is reported")
+    parser.add_argument("--workers", type=int, default=4, help="Connection pool size")
+    parser.add_argument("--rebuild", action="store_true", help="Regenerate the warehouse even if it exists")
+    parser.add_argument("--skip-render", action="store_true", help="Only time the loaders")
+    parser.add_argument("--compare", default=None, help="Results file to compare with (default: the latest one)")
+    args = parser.parse_args(argv)
+    # Span records are logged as JSON by profiling.py; keep them out of the report.
+    logging.getLogger("axelar_dashboard.profiling").setLevel(logging.WARNING)
+
+    workdir = Path(args.workdir).resolve()
+    compare = Path(args.compare).resolve() if args.compare else None
+    workdir.mkdir(parents=True, exist_ok=True)
+    start, end = date.fromisoformat(args.start), date.fromisoformat(args.end)
+    database = workdir / "axelar.duckdb"
+    params_file = workdir / "warehouse.json"
+    params = {"start": args.start, "end": args.end, "scale": args.scale}
+    if args.rebuild or not database.exists() or not params_file.exists() or json.loads(params_file.read_text())["params"] != params:
+        rows = build_warehouse(database, start, end, args.scale)
+        params_file.write_text(json.dumps({"params": params, "rows": rows}))
+    rows = json.loads(params_file.read_text())["rows"]
+
+    # Serve every loader from the local warehouse, with a throwaway store and no staging tables.
+    os.environ["AXELAR_DASHBOARD_STORE"] = str(workdir / "store")
+    (workdir / ".streamlit").mkdir(exist_ok=True)
+    (workdir / ".streamlit" / "secrets.toml").write_text(f'[store]\npath = "{workdir / "store"}"\n')
+    os.chdir(workdir)
+    connection._pool = connection.ConnectionPool(lambda: DuckDBConnection(str(database)), max_size=args.workers)
+
+    cases = {
+        "core": lambda: core.load_core_daily(start, end),
+        "squid": lambda: squid.load_squid_daily(start, end),
+        "satellite": lambda: satellite.load_satellite_daily(start, end),
+    }
+    if not args.skip_render:
+        cases["render"] = render
+    results = {
+        "commit": _commit(),
+        "params": params,
+        "rows": rows,
+        "cases": {name: measure(fn, args.repeat) for name, fn in cases.items()},
+    }
+
+    results_dir = workdir / "results"
+    previous = sorted(results_dir.glob("*.json")) if results_dir.is_dir() else []
+    baseline_path = compare or (previous[-1] if previous else None)
+    baseline = json.loads(baseline_path.read_text()) if baseline_path else None
+    path = save(results, results_dir)
+    report(results, baseline)
+    print(f"saved {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+import functools
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from axelar_dashboard.cancellation import QueryCancelled, get_supersession
+from axelar_dashboard.dtypes import frame_nbytes
+from axelar_dashboard.executor import PRIORITY_LOW, get_executor
+from axelar_dashboard.profiling import annotate
+from axelar_dashboard.singleflight import SingleFlight
+from axelar_dashboard.store import settled_before
+
+logger = logging.getLogger(__name__)
+
+
+class _Entry:
+    __slots__ = ("value", "nbytes", "expires_at")
+
+    def __init__(self, value, ttl):
+        self.value = value
+        self.nbytes = frame_nbytes(value)
+        self.expires_at = None if ttl is None else time.monotonic() + ttl
+
+
+class RangeCache:
+    """LRU cache of loader results bounded by entry count and bytes.
+
+    Ranges of settled days (see store.py) never expire.  Ranges that reach the
+    newer days, whose rows can still change, expire after ``open_ttl`` seconds; an expired entry keeps being served while
+    a query worker reloads it at low priority (stale-while-revalidate), so no request waits
+    on the warehouse because of a TTL.  Concurrent loads of one key are coalesced:
+    the first caller runs the loader and the others wait for its result.
+    """
+
+    def __init__(self, max_entries=128, max_bytes=256 * 1024 * 1024, open_ttl=900):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.open_ttl = open_ttl
+        self._entries = OrderedDict()
+        self._nbytes = 0
+        self._refreshing = set()
+        self._flights = SingleFlight()
+        self._lock = threading.Lock()
+
+    def get(self, key, load, unsettled):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                stale = entry.expires_at is not None and entry.expires_at <= time.monotonic()
+                if stale and key not in self._refreshing:
+                    self._refreshing.add(key)
+                    # Queued behind this rerun's own loads, and counted against the worker cap like them.
+                    get_executor().submit(self._refresh, key, load, unsettled, priority=PRIORITY_LOW)
+                annotate(cache="stale" if stale else "hit")
+                return entry.value
+        for attempt in range(3):
+            try:
+                with get_supersession().interest(key):
+                    value, shared = self._flights.do(key, lambda: self._load(key, load, unsettled))
+                break
+            except QueryCancelled:
+                # The load this caller joined was cancelled for superseded reruns; start a fresh one.
+                # interest() raises right away if this caller's rerun has been superseded too.
+                if attempt == 2:
+                    raise
+        annotate(cache="joined" if shared else "miss")
+        return value
+
+    def _load(self, key, load, unsettled):
+        value = load()
+        self._put(key, value, unsettled)
+        return value
+
+    def _refresh(self, key, load, unsettled):
+        try:
+            self._flights.do(key, lambda: self._load(key, load, unsettled))
+        except Exception:
+            logger.exception("Background refresh failed for %s; serving the stale value", key)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _put(self, key, value, unsettled):
+        entry = _Entry(value, self.open_ttl if unsettled else None)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._nbytes -= old.nbytes
+            self._entries[key] = entry
+            self._nbytes += entry.nbytes
+            while self._entries and (len(self._entries) > self.max_entries or self._nbytes > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self._nbytes -= evicted.nbytes
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    def stats(self):
+        """Size, and how many loads ran versus how many duplicate concurrent loads were avoided."""
+        with self._lock:
+            stats = {"entries": len(self._entries), "bytes": self._nbytes}
+        flights = self._flights.stats()
+        return {**stats, "loads": flights["executed"], "coalesced_loads": flights["coalesced"]}
+
+
+_cache = RangeCache()
+
+
+def cache_stats():
+    return _cache.stats()
+
+
+def range_cache(fn):
+    """Cache ``fn(start_date, end_date, *args)`` in the process-wide RangeCache."""
+    @functools.wraps(fn)
+    def wrapper(start_date, end_date, *args):
+        key = (fn.__module__, fn.__qualname__, start_date, end_date, *args)
+        unsettled = end_date >= settled_before()
+        value = _cache.get(key, lambda: fn(start_date, end_date, *args), unsettled)
+        # Callers derive new frames from the result; hand out a copy so the cached one stays intact.
+        return value.copy() if hasattr(value, "copy") else value
+    wrapper.cache = _cache
+    return wrapper
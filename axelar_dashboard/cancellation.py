@@ -0,0 +1,132 @@
+"""Cancel warehouse queries nobody is waiting for any more.
+
+Every rerun that submits loaders runs under a ticket: its session and that
+session's query generation, which advances whenever the session applies new
+filters.  Range-cache loads record which tickets are waiting on them; when a
+generation advances, every in-flight load that only superseded tickets still
+wait on is cancelled: loaders that have not started are dropped and running
+queries are aborted on the warehouse.  Loads without a ticket (the pre-warmer,
+background refreshes) are never cancelled.
+"""
+import contextvars
+import itertools
+import logging
+import threading
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+_ticket = contextvars.ContextVar("axelar_dashboard_ticket", default=None)
+_flight = contextvars.ContextVar("axelar_dashboard_flight", default=None)
+
+
+class QueryCancelled(Exception):
+    """The load was cancelled because every rerun that wanted it was superseded."""
+
+
+class _Flight:
+    def __init__(self, key):
+        self.key = key
+        self.tickets = []
+        self.hooks = []
+        self.cancelled = False
+
+
+class Supersession:
+    def __init__(self):
+        self._generations = {}
+        # Numbered across sessions, so a forgotten session that comes back never reuses an old generation.
+        self._counter = itertools.count(1)
+        self._flights = {}
+        self._lock = threading.Lock()
+        self.cancelled = 0
+
+    def _current(self, ticket):
+        # A forgotten session has no newer generation its tickets could be superseded by.
+        return ticket is None or self._generations.get(ticket[0], ticket[1]) == ticket[1]
+
+    def advance(self, session):
+        """Start a new generation for ``session`` and cancel the loads only its older ones wanted."""
+        with self._lock:
+            generation = self._generations[session] = next(self._counter)
+            doomed = [
+                flight for flight in self._flights.values()
+                if not flight.cancelled and not any(self._current(ticket) for ticket in flight.tickets)
+            ]
+            for flight in doomed:
+                flight.cancelled = True
+            self.cancelled += len(doomed)
+        for flight in doomed:
+            logger.info("Cancelling superseded load %s", flight.key)
+            for hook in list(flight.hooks):
+                try:
+                    hook()
+                except Exception:
+                    logger.exception("Could not cancel %s", flight.key)
+        return generation
+
+    def forget_ended(self, active):
+        """Drop the generations of the sessions for which ``active(session)`` is false."""
+        with self._lock:
+            for session in [session for session in self._generations if session is not None and not active(session)]:
+                del self._generations[session]
+
+    @contextmanager
+    def interest(self, key):
+        """Register the current ticket as waiting on ``key`` while the block runs."""
+        ticket = _ticket.get()
+        with self._lock:
+            if not self._current(ticket):
+                raise QueryCancelled(f"{key} was requested by a superseded rerun")
+            flight = self._flights.get(key)
+            if flight is None or flight.cancelled:
+                flight = self._flights[key] = _Flight(key)
+            flight.tickets.append(ticket)
+        token = _flight.set(flight)
+        try:
+            yield flight
+        finally:
+            _flight.reset(token)
+            with self._lock:
+                flight.tickets.remove(ticket)
+                if not flight.tickets and self._flights.get(key) is flight:
+                    del self._flights[key]
+
+
+_supersession = Supersession()
+
+
+def get_supersession():
+    return _supersession
+
+
+@contextmanager
+def ticket(session, generation):
+    """Run the block on behalf of ``session``'s ``generation``."""
+    token = _ticket.set(None if session is None else (session, generation))
+    try:
+        yield
+    finally:
+        _ticket.reset(token)
+
+
+@contextmanager
+def on_cancel(hook):
+    """Call ``hook`` (e.g. abort the running query) if the load this block works for is cancelled."""
+    flight = _flight.get()
+    if flight is None:
+        yield
+        return
+    with _supersession._lock:
+        if flight.cancelled:
+            raise QueryCancelled(f"{flight.key} was cancelled")
+        flight.hooks.append(hook)
+    try:
+        yield
+    except Exception as exc:
+        if flight.cancelled:
+            raise QueryCancelled(f"{flight.key} was cancelled") from exc
+        raise
+    finally:
+        with _supersession._lock:
+            flight.hooks.remove(hook)
@@ -0,0 +1,128 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+# Points per figure above which traces are drawn with WebGL instead of SVG.
+WEBGL_THRESHOLD = 1000
+# Line traces longer than this are downsampled with LTTB.
+MAX_LINE_POINTS = 1000
+MAX_FIGURES = 256
+
+
+# --- Downsampling ----------------------------------------------------------------------------------------------------------------
+def lttb(x, y, n_out):
+    """Indices of the ``n_out`` points that Largest-Triangle-Three-Buckets keeps from (x, y)."""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.nan_to_num(np.asarray(y, dtype=np.float64))
+    # n_out - 2 buckets over the interior points; the first and last points are always kept.
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start, next_end = (end, edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        avg_x, avg_y = x[next_start:next_end].mean(), y[next_start:next_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        keep[i + 1] = a
+    return keep
+
+
+def _as_numbers(values):
+    values = np.asarray(values)
+    if values.dtype.kind in "iuf":
+        return values
+    return pd.to_datetime(values).asi8
+
+
+# --- WebGL -----------------------------------------------------------------------------------------------------------------------
+def _webgl_line(trace):
+    spec = trace.to_plotly_json()
+    spec.pop("type", None)
+    return go.Scattergl(spec)
+
+
+def _webgl_bars(bars, stacked):
+    # Plotly has no WebGL bar trace; large bar series become step areas, stacked like the bars were.
+    index = pd.Index(sorted(set().union(*(bar.x for bar in bars))))
+    base = pd.Series(0.0, index=index)
+    traces = []
+    for bar in bars:
+        values = pd.Series(np.asarray(bar.y, dtype=np.float64), index=pd.Index(bar.x)).groupby(level=0).sum()
+        values = values.reindex(index, fill_value=0.0)
+        top = base + values if stacked else values
+        traces.append(go.Scattergl(
+            x=index, y=top, customdata=values,
+            mode="lines", line=dict(shape="hv", width=1, color=bar.marker.color),
+            fill="tonexty" if stacked and traces else "tozeroy", fillcolor=bar.marker.color,
+            name=bar.name, legendgroup=bar.legendgroup, showlegend=bar.showlegend,
+            xaxis=bar.xaxis, yaxis=bar.yaxis,
+            hovertemplate=f"{bar.name or ''} %{{x}}: %{{customdata:,}}<extra></extra>",
+        ))
+        if stacked:
+            base = top
+    return traces
+
+
+def _points(trace):
+    return len(trace.x) if trace.type in ("bar", "scatter") and trace.x is not None else 0
+
+
+def optimize(fig, webgl_threshold=WEBGL_THRESHOLD, max_line_points=MAX_LINE_POINTS):
+    """Downsample long line traces and switch large figures to WebGL; returns ``fig``."""
+    for trace in fig.data:
+        if trace.type == "scatter" and "lines" in (trace.mode or "") and _points(trace) > max_line_points:
+            keep = lttb(_as_numbers(trace.x), trace.y, max_line_points)
+            trace.x, trace.y = np.asarray(trace.x)[keep], np.asarray(trace.y)[keep]
+
+    if sum(_points(trace) for trace in fig.data) <= webgl_threshold:
+        return fig
+    bars = [trace for trace in fig.data if trace.type == "bar"]
+    others = [_webgl_line(trace) if trace.type == "scatter" else trace for trace in fig.data if trace.type != "bar"]
+    stacked = fig.layout.barmode in ("stack", "relative")
+    fig.data = ()
+    fig.add_traces((_webgl_bars(bars, stacked) if bars else []) + others)
+    return fig
+
+
+# --- Figure Cache ----------------------------------------------------------------------------------------------------------------
+def frame_key(df):
+    """Content hash of a DataFrame: values, index, column names and dtypes."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+    digest.update(repr([(str(column), str(dtype)) for column, dtype in df.dtypes.items()]).encode("utf-8"))
+    return digest.hexdigest()
+
+
+_figures = OrderedDict()
+_figures_lock = threading.Lock()
+
+
+def cached_figure(name, df, build, *args):
+    """``build(df, *args)`` as an optimized figure, reused while ``df`` has the same content.
+
+    ``name`` identifies the chart; the cache is process-wide, so every session that
+    draws the same chart from the same data shares one built figure; callers must
+    not change it.  It is kept as a ``go.Figure``, not a dict: ``st.plotly_chart``
+    re-validates a dict into a new figure on every call, which costs far more than
+    the JSON encoding it still does per call (Streamlit takes no pre-encoded spec).
+    """
+    key = (name, frame_key(df), args)
+    with _figures_lock:
+        if key in _figures:
+            _figures.move_to_end(key)
+            return _figures[key]
+    figure = optimize(build(df, *args))
+    with _figures_lock:
+        _figures[key] = figure
+        while len(_figures) > MAX_FIGURES:
+            _figures.popitem(last=False)
+    return figure
@@ -0,0 +1,59 @@
+import pandas as pd
+
+from axelar_dashboard.aggregate import truncate
+from axelar_dashboard.cache import range_cache
+from axelar_dashboard.daily import load_daily
+from axelar_dashboard.queries import CORE_DAILY
+from axelar_dashboard.sketch import distinct_count
+
+
+# --- Core Transactions: one daily fetch per date range ------------------------------------------------------------------------
+# One row per (day, status). Transaction counts add up across days; distinct users travel as an
+# HLL_EXPORT state so week/month buckets and the KPI totals are merged locally and switching the
+# timeframe never reaches the warehouse.
+@range_cache
+def load_core_daily(start_date, end_date):
+    return load_daily(CORE_DAILY, start_date, end_date)
+
+
+def _succeeded(daily):
+    return daily[daily["STATUS"] == "Succeeded"]
+
+
+def _avg_per_user(txns, users):
+    return round(txns / users) if users else None
+
+
+# --- Derived Views -----------------------------------------------------------------------------------------------------------
+def kpi_data(daily):
+    succeeded = _succeeded(daily)
+    txns = int(succeeded["N_TXNS"].sum())
+    users = distinct_count(succeeded["USERS_HLL"])
+    return pd.DataFrame({
+        "Number of Txns": [txns],
+        "Number of Users": [users],
+        "Avg Txn per User": [_avg_per_user(txns, users)],
+    })
+
+
+def txn_status_data(daily, timeframe):
+    df = daily.assign(Date=truncate(daily["DAY"], timeframe))
+    df = df.groupby(["Date", "STATUS"], as_index=False, observed=True)["N_TXNS"].sum()
+    df = df.rename(columns={"N_TXNS": "Number of Txns", "STATUS": "Status"})
+    return df[["Date", "Number of Txns", "Status"]].sort_values("Date", ignore_index=True)
+
+
+def users_data(daily, timeframe):
+    succeeded = _succeeded(daily)
+    grouped = succeeded.groupby(truncate(succeeded["DAY"], timeframe).rename("Date"))
+    df = pd.DataFrame({
+        "Number of Users": grouped["USERS_HLL"].agg(distinct_count),
+        "Number of Txns": grouped["N_TXNS"].sum(),
+    }).reset_index()
+    df["Avg Txn per User"] = [_avg_per_user(t, u) for t, u in zip(df["Number of Txns"], df["Number of Users"])]
+    return df[["Date", "Number of Users", "Avg Txn per User"]].sort_values("Date", ignore_index=True)
+
+
+def status_pie_data(daily):
+    df = daily.groupby("STATUS", as_index=False, observed=True)["N_TXNS"].sum()
+    return df.rename(columns={"STATUS": "Status", "N_TXNS": "Number of Txns"})
@@ -0,0 +1,190 @@
+"""Prefix-sum cube of (source chain, destination chain) × day totals.
+
+Each measure is kept as a dense ``(pairs, days + 1)`` array of running sums along
+the day axis, so its total over any range of loaded days is one subtraction per
+chain pair.  The loaders add every settled day they read (see squid.py,
+satellite.py and store.py), so the bubbles of any range the cube holds need no
+grouping of day rows; newer days are never added because their rows can still
+change.
+"""
+import threading
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+from axelar_dashboard.store import settled_before
+
+
+class ChainDictionary:
+    """Chain names interned as int16 codes in order of first appearance; a NULL chain gets a code too."""
+
+    def __init__(self):
+        self.names = []
+        self._codes = {}
+
+    def _code(self, name):
+        name = None if pd.isna(name) else name
+        if name not in self._codes:
+            self._codes[name] = len(self.names)
+            self.names.append(name)
+        return self._codes[name]
+
+    def encode(self, values):
+        inverse, uniques = pd.factorize(np.asarray(values, dtype=object), use_na_sentinel=False)
+        return np.array([self._code(name) for name in uniques], dtype=np.int16)[inverse]
+
+    def lookup(self, names):
+        """Codes of the known names among ``names``; unknown ones are skipped, not added."""
+        return np.array([self._codes[name] for name in names if name in self._codes], dtype=np.int16)
+
+    def decode(self, codes):
+        return np.array(self.names, dtype=object)[codes]
+
+
+class PairCube:
+    """Running sums of ``measures`` per chain pair over a contiguous span of days.
+
+    With ``priced``, only rows where that count is positive are summed, e.g. the
+    rows with a USD-priced transfer, the only ones the bubbles show.
+    """
+
+    def __init__(self, measures, priced=None):
+        self.measures = tuple(measures)
+        self.priced = priced
+        self.chains = ChainDictionary()
+        self.first_day = None
+        self.loaded = np.zeros(0, dtype=bool)
+        self._rows = {}
+        self._pairs = np.empty((0, 2), dtype=np.int16)
+        self._cum = {measure: np.zeros((0, 1)) for measure in self.measures}
+        self._lock = threading.Lock()
+
+    def _index(self, day):
+        return int((np.datetime64(day, "D") - self.first_day).astype(np.int64))
+
+    def _span(self, first, last):
+        # Days before the span start at zero; days after it carry the last running sum forward.
+        if self.first_day is None:
+            self.first_day = first
+        before = max(0, -self._index(first))
+        after = max(0, self._index(last) - (len(self.loaded) - 1))
+        if not before and not after:
+            return
+        for measure, cum in self._cum.items():
+            self._cum[measure] = np.concatenate(
+                [np.zeros((len(cum), before)), cum, np.repeat(cum[:, -1:], after, axis=1)], axis=1
+            )
+        self.loaded = np.concatenate([np.zeros(before, dtype=bool), self.loaded, np.zeros(after, dtype=bool)])
+        self.first_day = min(self.first_day, first)
+
+    def _pair_rows(self, sources, destinations):
+        keys = (sources.astype(np.int32) << 16) | destinations.astype(np.int32)
+        unique, inverse = np.unique(keys, return_inverse=True)
+        added = [key for key in unique.tolist() if key not in self._rows]
+        for key in added:
+            self._rows[key] = len(self._rows)
+        if added:
+            added = np.array(added, dtype=np.int32)
+            self._pairs = np.concatenate([self._pairs, np.stack([added >> 16, added & 0xFFFF], axis=1).astype(np.int16)])
+            for measure, cum in self._cum.items():
+                self._cum[measure] = np.concatenate([cum, np.zeros((len(added), cum.shape[1]))])
+        return np.array([self._rows[key] for key in unique.tolist()], dtype=np.int64)[inverse]
+
+    def add(self, daily, start_date, end_date, day_column="DAY", source="SOURCE_CHAIN", destination="DESTINATION_CHAIN"):
+        """Fold ``daily``, the rows of [start_date, end_date], into the cube.
+
+        Every settled day of the range the cube does not hold yet is marked loaded,
+        including days without (priced) rows, whose sums are zero.
+        """
+        first = np.datetime64(start_date, "D")
+        last = min(np.datetime64(end_date, "D"), np.datetime64(settled_before(), "D") - 1)
+        if last < first:
+            return
+        daily = self.rows(daily)
+        days = daily[day_column].to_numpy().astype("datetime64[D]")
+        with self._lock:
+            self._span(first, last)
+            start, stop = self._index(first), self._index(last) + 1
+            index = (days - self.first_day).astype(np.int64)
+            new = (index >= start) & (index < stop)
+            new[new] = ~self.loaded[index[new]]
+            if new.any():
+                rows = self._pair_rows(
+                    self.chains.encode(daily[source].to_numpy()[new]),
+                    self.chains.encode(daily[destination].to_numpy()[new]),
+                )
+                for measure in self.measures:
+                    delta = np.zeros((len(self._pairs), len(self.loaded)))
+                    np.add.at(delta, (rows, index[new]), np.nan_to_num(daily[measure].to_numpy(dtype=np.float64)[new]))
+                    self._cum[measure][:, 1:] += np.cumsum(delta, axis=1)
+            self.loaded[start:stop] = True
+
+    def rows(self, daily):
+        """The rows of ``daily`` the cube sums."""
+        return daily[daily[self.priced] > 0] if self.priced else daily
+
+    def _covers(self, start_date, end_date):
+        if self.first_day is None:
+            return False
+        first, last = self._index(start_date), self._index(end_date)
+        return first >= 0 and last < len(self.loaded) and bool(self.loaded[first:last + 1].all())
+
+    def totals(self, start_date, end_date, sources=()):
+        """Per-pair sums over [start_date, end_date], pairs with nothing in the range left out.
+
+        None unless every day of the range is loaded; checked under the same lock as the sums,
+        so a concurrent ``add`` cannot change the span in between.
+        """
+        with self._lock:
+            if start_date > end_date:
+                return pd.DataFrame(columns=["SOURCE_CHAIN", "DESTINATION_CHAIN", *self.measures])
+            if not self._covers(start_date, end_date):
+                return None
+            first, last = self._index(start_date), self._index(end_date) + 1
+            sums = {measure: cum[:, last] - cum[:, first] for measure, cum in self._cum.items()}
+            keep = np.logical_or.reduce([values != 0 for values in sums.values()])
+            if len(sources):
+                keep &= np.isin(self._pairs[:, 0], self.chains.lookup(sources))
+            return pd.DataFrame({
+                "SOURCE_CHAIN": self.chains.decode(self._pairs[keep, 0]),
+                "DESTINATION_CHAIN": self.chains.decode(self._pairs[keep, 1]),
+                **{measure: values[keep] for measure, values in sums.items()},
+            })
+
+
+_cubes = {}
+_cubes_lock = threading.Lock()
+
+
+def get_cube(name, measures, priced=None):
+    """Process-wide cube for one dataset."""
+    with _cubes_lock:
+        if name not in _cubes:
+            _cubes[name] = PairCube(measures, priced)
+        return _cubes[name]
+
+
+def pair_totals(cube, daily, start_date, end_date, sources=(), day_column="DAY"):
+    """Per-pair sums of the cube's measures over [start_date, end_date].
+
+    Settled days come from ``cube`` when it holds all of them; otherwise, and for the
+    newer days, the rows of ``daily`` (already filtered to ``sources``) are grouped.
+    """
+    daily = cube.rows(daily)
+    cutoff = settled_before()
+    settled = cube.totals(start_date, min(end_date, cutoff - timedelta(days=1)), sources)
+    if settled is not None:
+        parts = [settled, daily.loc[daily[day_column] >= pd.Timestamp(cutoff)]]
+    else:
+        parts = [daily]
+    columns = ["SOURCE_CHAIN", "DESTINATION_CHAIN", *cube.measures]
+    parts = [part[columns].astype({"SOURCE_CHAIN": object, "DESTINATION_CHAIN": object}) for part in parts if len(part)]
+    if not parts:
+        return pd.DataFrame(columns=columns)
+    grouped = pd.concat(parts).groupby(["SOURCE_CHAIN", "DESTINATION_CHAIN"], dropna=False)[list(cube.measures)].sum()
+    # The cube sums in float64.  Integer counts go back to int64, not the daily frame's type:
+    # compact_frame downcasts that to fit one day's counts, which totals over many days overflow.
+    return grouped.astype({
+        measure: "int64" for measure in cube.measures if pd.api.types.is_integer_dtype(daily[measure].dtype)
+    }).reset_index()
@@ -0,0 +1,37 @@
+"""Day-grain rows of a DailySpec (see queries.py), for any section.
+
+Settled days come from the local day store; only missing days and the last few
+(see store.py) reach a backend.  The local mirror serves ranges it holds in full,
+Snowflake everything else (see backends.py), and on Snowflake pre-flattened
+staging tables replace the raw fact CTE when they hold the whole range (see
+staging.py).
+"""
+import functools
+
+import pandas as pd
+
+from axelar_dashboard.backends import backend_for
+from axelar_dashboard.dtypes import compact_frame
+from axelar_dashboard.queries import build_daily_query
+from axelar_dashboard.store import get_store
+
+
+def fetch_daily(spec, backend, start_date, end_date):
+    """``spec``'s rows for [start_date, end_date], read from ``backend`` in one query."""
+    query, params = build_daily_query(spec, start_date, end_date, facts=backend.facts_for(spec, start_date, end_date))
+    df = backend.read_frame(query, params, categories=spec.categories)
+    df["DAY"] = pd.to_datetime(df["DAY"])
+    return df
+
+
+def daily_source(spec, start_date, end_date):
+    """``(dataset, fetch)`` for the day store: where ``spec``'s days live and how missing ones are fetched."""
+    backend = backend_for(start_date, end_date)
+    return backend.dataset(spec.dataset), functools.partial(fetch_daily, spec, backend)
+
+
+def load_daily(spec, start_date, end_date):
+    dataset, fetch = daily_source(spec, start_date, end_date)
+    daily = get_store().load_range(dataset, start_date, end_date, fetch)
+    # Days read back from separate files carry their own category sets; re-compact after concatenating.
+    return compact_frame(daily, spec.categories)
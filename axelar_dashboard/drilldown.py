@@ -0,0 +1,172 @@
+"""Raw rows behind a chart selection, one keyset page at a time.
+
+A drill-down pages through the fact rows of one selection (a date range and
+optionally a status or a chain pair) in (timestamp, id) order.  Each page starts
+strictly after the last row of the previous one::
+
+    ts > :after_ts OR (ts = :after_ts AND id > :after_id)
+
+so every page costs about what the first one does, where LIMIT/OFFSET would
+read and discard all the rows before it.  Only the columns the table shows are
+selected.  While a page is on screen the next one is fetched in the background,
+and each session keeps at most ``MAX_SESSION_ROWS`` rows of pages, dropping the
+least recently used.
+"""
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+import pandas as pd
+
+from axelar_dashboard.backends import backend_for
+from axelar_dashboard.executor import PRIORITY_LOW, get_executor
+from axelar_dashboard.queries import CORE_FACTS, SQUID_FACTS, range_params
+
+PAGE_ROWS = 100
+MAX_SESSION_ROWS = 2000
+
+
+# --- Row Sources -----------------------------------------------------------------------------------------------------------------
+@dataclass(frozen=True)
+class RowSource:
+    name: str
+    facts: str  # CTE body, the same one the daily aggregates are computed from
+    columns: tuple  # (column alias, expression) pairs, in table order
+    order: tuple  # aliases of (timestamp, unique id): the keyset
+    filters: tuple  # fact columns a selection can pin to one value
+    where: tuple = ()  # predicates on fact columns every page applies: the rows the charts count
+
+
+CORE_ROWS = RowSource(
+    name="core",
+    facts=CORE_FACTS,
+    columns=(("BLOCK_TIMESTAMP", "ts"), ("TX_ID", "tx_id"), ("TX_FROM", "user"), ("STATUS", "status")),
+    order=("BLOCK_TIMESTAMP", "TX_ID"),
+    filters=("status",),
+)
+
+SQUID_ROWS = RowSource(
+    name="squid",
+    facts=SQUID_FACTS,
+    columns=(
+        ("CREATED_AT", "ts"), ("ID", "id"), ("SERVICE", "service"), ("SOURCE_CHAIN", "source_chain"),
+        ("DESTINATION_CHAIN", "destination_chain"), ("USER", "user"), ("AMOUNT_USD", "amount_usd"), ("FEE", "fee"),
+    ),
+    order=("CREATED_AT", "ID"),
+    filters=("source_chain", "destination_chain"),
+    # The chain-pair bubbles sum USD-priced transfers only (see squid.py).
+    where=("amount_usd IS NOT NULL",),
+)
+
+ROW_SOURCES = {source.name: source for source in (CORE_ROWS, SQUID_ROWS)}
+
+
+@dataclass(frozen=True)
+class Selection:
+    source: str  # a ROW_SOURCES name
+    start_date: date
+    end_date: date
+    filters: tuple = ()  # sorted (fact column, value) pairs
+
+    def describe(self):
+        pinned = ", ".join(f"{column.replace('_', ' ')} = {value}" for column, value in self.filters)
+        return f"{self.start_date} → {self.end_date}" + (f" · {pinned}" if pinned else "")
+
+
+def bucket_range(bucket, timeframe, start_date, end_date):
+    """The days of the ``timeframe`` bucket starting at ``bucket`` (see aggregate.truncate), within the page's range."""
+    first = pd.Timestamp(bucket).date()
+    if timeframe == "day":
+        last = first
+    elif timeframe == "week":
+        last = first + timedelta(days=6)
+    else:
+        last = (pd.Timestamp(first) + pd.offsets.MonthEnd(0)).date()
+    return max(first, start_date), min(last, end_date)
+
+
+# --- Pages -----------------------------------------------------------------------------------------------------------------------
+def build_page_query(selection, after=None, limit=PAGE_ROWS):
+    """One page of ``selection`` after the keyset cursor ``after`` ((timestamp, id) of the last row shown, or None)."""
+    source = ROW_SOURCES[selection.source]
+    expressions = dict(source.columns)
+    ts, key = (expressions[alias] for alias in source.order)
+    where = list(source.where)
+    params = range_params(selection.start_date, selection.end_date)
+    for column, value in selection.filters:
+        if column not in source.filters:
+            raise ValueError(f"{source.name} rows cannot be filtered on {column}")
+        where.append(f"{column} = %({column})s")
+        params[column] = value
+    if after is not None:
+        where.append(f"({ts} > CAST(%(after_ts)s AS TIMESTAMP) OR ({ts} = CAST(%(after_ts)s AS TIMESTAMP) AND {key} > %(after_id)s))")
+        params.update(after_ts=pd.Timestamp(after[0]).isoformat(sep=" "), after_id=after[1])
+    select = ", ".join(f"{expr} AS {alias}" for alias, expr in source.columns)
+    query = (
+        f"WITH facts AS ({source.facts})\nSELECT {select}\nFROM facts\n"
+        + (f"WHERE {' AND '.join(where)}\n" if where else "")
+        # One row past the page tells whether there is a next one.
+        + f"ORDER BY {ts}, {key}\nLIMIT {int(limit) + 1}"
+    )
+    return query, params
+
+
+def fetch_page(selection, after=None, limit=PAGE_ROWS):
+    """Return ``(rows, next_after)``: up to ``limit`` rows and the cursor of the next page (None on the last one)."""
+    source = ROW_SOURCES[selection.source]
+    query, params = build_page_query(selection, after, limit)
+    rows = backend_for(selection.start_date, selection.end_date).read_frame(query, params)
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows.iloc[:limit]
+    last = rows.iloc[-1]
+    return rows, (last[source.order[0]], last[source.order[1]])
+
+
+class SessionPages:
+    """One session's pages, fetched or being fetched, least recently used first.
+
+    Whenever a page is requested, finished pages beyond ``max_rows`` rows are dropped,
+    oldest first; the page just requested and pages still loading are kept.
+    """
+
+    def __init__(self, session=None, max_rows=MAX_SESSION_ROWS):
+        self.session = session
+        self.max_rows = max_rows
+        self._pages = OrderedDict()  # (selection, after) -> Future of (rows, next_after)
+        self._lock = threading.Lock()
+
+    def page(self, selection, after=None):
+        """The Future of one page, submitted to the worker pool unless it is already cached or in flight."""
+        key = (selection, after)
+        with self._lock:
+            future = self._pages.get(key)
+            # A failed page is fetched again rather than served from the cache.
+            if future is None or (future.done() and future.exception() is not None):
+                future = self._pages[key] = get_executor().submit(
+                    fetch_page, selection, after, priority=PRIORITY_LOW, session=self.session
+                )
+            self._pages.move_to_end(key)
+            self._evict()
+        return future
+
+    def prefetch(self, selection, after):
+        if after is not None:
+            self.page(selection, after)
+
+    def _rows(self, future):
+        if not future.done() or future.exception() is not None:
+            return 0
+        return len(future.result()[0])
+
+    def _evict(self):
+        # Pages still loading are kept; failed ones count as empty and go first when older.
+        total = sum(self._rows(future) for future in self._pages.values())
+        for key in list(self._pages)[:-1]:
+            if total <= self.max_rows:
+                break
+            future = self._pages[key]
+            if future.done():
+                total -= self._rows(future)
+                del self._pages[key]
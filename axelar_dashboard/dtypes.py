@@ -0,0 +1,20 @@
+import pandas as pd
+
+
+def frame_nbytes(df):
+    try:
+        return int(df.memory_usage(deep=True).sum())
+    except AttributeError:
+        return 0
+
+
+def compact_frame(df, categories=()):
+    """Downcast a result frame in place: categoricals for the given label columns, sized integers for counts."""
+    for column in df.columns:
+        series = df[column]
+        if column in categories:
+            if not isinstance(series.dtype, pd.CategoricalDtype):
+                df[column] = series.astype("category")
+        elif pd.api.types.is_integer_dtype(series.dtype):
+            df[column] = pd.to_numeric(series, downcast="integer")
+    return df
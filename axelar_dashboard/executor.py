@@ -0,0 +1,189 @@
+import concurrent.futures
+import contextvars
+import itertools
+import queue
+import threading
+from concurrent.futures import Future
+
+import streamlit as st
+from streamlit import runtime
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from streamlit.runtime.scriptrunner_utils.script_run_context import SCRIPT_RUN_CONTEXT_ATTR_NAME
+
+from axelar_dashboard.cancellation import get_supersession, ticket
+from axelar_dashboard.profiling import span
+
+# Lower runs first when workers are busy: KPI-bearing sections above the fold before heavy joins below it.
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+
+class PriorityExecutor:
+    """Fixed pool of worker threads that take queued calls lowest priority first, fair across sessions within a priority.
+
+    The worker count is the process-wide cap on concurrent loaders.  Within a
+    priority, calls are served in turns (start-time fair queueing): a session's
+    next call is queued one turn after its previous one, but never before the
+    turn being served, so a session that submits many calls at once cannot make
+    the others wait behind all of them.  Calls without a session share one.
+    """
+
+    def __init__(self, max_workers, thread_name_prefix="query"):
+        self._queue = queue.PriorityQueue()
+        self._order = itertools.count()
+        self._turn = 0
+        self._last_turn = {}
+        self._lock = threading.Lock()
+        for i in range(max_workers):
+            threading.Thread(target=self._work, name=f"{thread_name_prefix}_{i}", daemon=True).start()
+
+    def submit(self, fn, *args, priority=PRIORITY_NORMAL, session=None, **kwargs):
+        future = Future()
+        with self._lock:
+            turn = max(self._last_turn.get(session, -1) + 1, self._turn)
+            self._last_turn[session] = turn
+            if len(self._last_turn) > 1024:
+                # Sessions whose last turn has been served would be queued at the current turn anyway.
+                self._last_turn = {key: value for key, value in self._last_turn.items() if value > self._turn}
+        self._queue.put((priority, turn, next(self._order), future, fn, args, kwargs))
+        return future
+
+    def _work(self):
+        while True:
+            _, turn, _, future, fn, args, kwargs = self._queue.get()
+            with self._lock:
+                self._turn = max(self._turn, turn)
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """Process-wide worker pool, sized to the connection pool so workers never idle on a free slot."""
+    global _executor
+    if _executor is None:
+        from axelar_dashboard.connection import pool_size
+
+        with _executor_lock:
+            if _executor is None:
+                _executor = PriorityExecutor(max_workers=pool_size(), thread_name_prefix="query")
+    return _executor
+
+
+def _with_ticket(session, generation, fn):
+    def run(*args, **kwargs):
+        with ticket(session, generation):
+            return fn(*args, **kwargs)
+    return run
+
+
+def _with_script_ctx(ctx, fn):
+    # Loaders read st.secrets and may call other Streamlit APIs; give the worker the caller's
+    # script context so Streamlit treats the call as part of this rerun, and the caller's
+    # context variables so its spans land in this rerun's profile.
+    context = contextvars.copy_context()
+
+    def run(*args, **kwargs):
+        thread = threading.current_thread()
+        previous = get_script_run_ctx(suppress_warning=True)
+        add_script_run_ctx(thread, ctx)
+        try:
+            return context.run(fn, *args, **kwargs)
+        finally:
+            # Workers are shared: the next call, maybe another session's or one without a session, must not
+            # run under this one's context (add_script_run_ctx cannot detach, hence the attribute).
+            setattr(thread, SCRIPT_RUN_CONTEXT_ATTR_NAME, previous)
+    return run
+
+
+def _timed(name, fn):
+    def run(*args, **kwargs):
+        with span(getattr(fn, "__name__", name), "loader", section=name):
+            return fn(*args, **kwargs)
+    return run
+
+
+class QueryBatch:
+    """Loader calls for one rerun, submitted up front and collected when their chart is drawn.
+
+    Calls are queued under the session that made them and run for its query
+    ``generation`` (see cancellation.py), so they are cancelled once the session
+    has moved on to other filters and nobody else waits for them.
+    """
+
+    def __init__(self, executor=None, generation=0):
+        self._executor = executor or get_executor()
+        self._futures = {}
+        ctx = get_script_run_ctx()
+        self.session = ctx.session_id if ctx is not None else None
+        self.generation = generation
+
+    def submit(self, name, fn, *args, priority=PRIORITY_NORMAL, **kwargs):
+        ctx = get_script_run_ctx()
+        task = _with_script_ctx(ctx, _with_ticket(self.session, self.generation, _timed(name, fn)))
+        self._futures[name] = self._executor.submit(task, *args, priority=priority, session=self.session, **kwargs)
+        return self._futures[name]
+
+    def cancel_pending(self):
+        """Drop the calls that have not started; running ones are left to cancellation.py."""
+        for future in self._futures.values():
+            future.cancel()
+
+    def ensure(self, name, fn, *args, **kwargs):
+        """Submit ``fn`` under ``name`` unless something already was, e.g. by an earlier part of the rerun."""
+        if name in self._futures:
+            return self._futures[name]
+        return self.submit(name, fn, *args, **kwargs)
+
+    def pending(self, name):
+        return name in self._futures and not self._futures[name].done()
+
+    def as_completed(self, names):
+        """Yield ``names`` in the order their loaders finish (failed ones included)."""
+        by_future = {self._futures[name]: name for name in names}
+        for future in concurrent.futures.as_completed(by_future):
+            yield by_future[future]
+
+    def result(self, name, timeout=None):
+        return self._futures[name].result(timeout=timeout)
+
+    def get(self, name, timeout=None):
+        """Return the loader's result, or show an error in place and return None if it failed."""
+        try:
+            return self.result(name, timeout=timeout)
+        except Exception as exc:
+            st.error(f"⚠️ Could not load this section ({name}): {exc}")
+            return None
+
+
+def session_batch(filters):
+    """A QueryBatch for this rerun of the current session.
+
+    When ``filters`` (whatever the queries depend on) differ from the session's
+    previous rerun, its query generation advances: the previous batch's calls
+    that have not started are dropped and in-flight loads nobody else waits for
+    are cancelled.
+    """
+    state = st.session_state
+    ctx = get_script_run_ctx()
+    if state.get("query_filters") != filters:
+        if "query_batch" in state:
+            state["query_batch"].cancel_pending()
+        state["query_filters"] = filters
+        supersession = get_supersession()
+        if runtime.exists():
+            # Forget sessions that are no longer connected; one that reconnects gets a fresh generation on its next change.
+            supersession.forget_ended(runtime.get_instance().is_active_session)
+        state["query_generation"] = supersession.advance(ctx.session_id if ctx is not None else None)
+    state["query_batch"] = QueryBatch(generation=state["query_generation"])
+    return state["query_batch"]
@@ -0,0 +1,287 @@
+"""Headless export of the dashboard's datasets, by name and date range.
+
+    python -m axelar_dashboard.export --list
+    python -m axelar_dashboard.export squid.source_dest --start 2025-01-01 --end 2025-08-31 -o pairs.parquet
+    python -m axelar_dashboard.export satellite.over_time --timeframe week --format csv > users.csv
+    python -m axelar_dashboard.export squid.daily --source-chain ethereum --format jsonl -o squid.jsonl
+    python -m axelar_dashboard.export --serve 127.0.0.1:8765     # GET /datasets, GET /export/<name>?start=&end=&...
+
+Every dataset is computed by the same loaders and derived views as the page, so
+an export goes through the same caches (range cache, day store, shared result
+cache) and returns the numbers the page shows.  ``<section>.daily`` datasets are
+the loaders' day-grain rows, distinct users included as mergeable ``HLL_EXPORT``
+states; they are loaded and written one window of days at a time, so a long
+range is never held in memory at once.  Output is written in record batches as
+Parquet, CSV or JSON lines, with a stable schema: plain strings instead of
+categoricals and 64-bit numbers instead of the page's downcast ones.
+
+The HTTP endpoint has no authentication; bind it to a private address.
+"""
+import argparse
+import itertools
+import json
+import logging
+import sys
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pyarrow as pa
+import pyarrow.csv
+import pyarrow.parquet as pq
+
+from axelar_dashboard import core, satellite, squid
+from axelar_dashboard.prewarm import DEFAULT_RANGE, parse_range
+from axelar_dashboard.store import day_windows
+
+logger = logging.getLogger(__name__)
+
+FORMATS = {"parquet": "application/vnd.apache.parquet", "csv": "text/csv", "jsonl": "application/x-ndjson"}
+
+
+# --- Datasets ----------------------------------------------------------------------------------------------------------------------
+# name -> (loader, view, has source chains); views are called as view(daily, start_date, end_date, timeframe, sources).
+def _rows(daily, start_date, end_date, timeframe, sources):
+    return daily
+
+
+def _whole(view):
+    return lambda daily, start_date, end_date, timeframe, sources: view(daily)
+
+
+def _by_timeframe(view):
+    return lambda daily, start_date, end_date, timeframe, sources: view(daily, timeframe)
+
+
+def _by_pair(view):
+    return lambda daily, start_date, end_date, timeframe, sources: view(daily, start_date, end_date, sources)
+
+
+DATASETS = {
+    "core.daily": (core.load_core_daily, _rows, False),
+    "core.kpi": (core.load_core_daily, _whole(core.kpi_data), False),
+    "core.txn_status": (core.load_core_daily, _by_timeframe(core.txn_status_data), False),
+    "core.users": (core.load_core_daily, _by_timeframe(core.users_data), False),
+    "core.status": (core.load_core_daily, _whole(core.status_pie_data), False),
+    "squid.daily": (squid.load_squid_daily, _rows, True),
+    "squid.kpi": (squid.load_squid_daily, _whole(squid.squid_kpi), True),
+    "squid.time_series": (squid.load_squid_daily, _by_timeframe(squid.squid_time_series), True),
+    "squid.source_dest": (squid.load_squid_daily, _by_pair(squid.squid_source_dest), True),
+    "satellite.daily": (satellite.load_satellite_daily, _rows, True),
+    "satellite.kpi": (satellite.load_satellite_daily, _whole(satellite.satellite_kpi), True),
+    "satellite.over_time": (satellite.load_satellite_daily, _by_timeframe(satellite.satellite_over_time), True),
+    "satellite.source_dest": (satellite.load_satellite_daily, _by_pair(satellite.satellite_src_dest), True),
+}
+
+TIMEFRAMES = ("day", "week", "month")
+
+
+def iter_frames(name, start_date, end_date, timeframe="day", sources=(), window_days=31):
+    """Dataset ``name`` for the range as an iterator of frames, computed the way the page computes it.
+
+    Day-grain datasets come one window of ``window_days`` days at a time; derived views
+    need the whole range and come as a single frame.  ``sources`` restricts the
+    Squid and Satellite datasets to those source chains, like the sections' filter.
+    Arguments are checked here, before anything is loaded.
+    """
+    if name not in DATASETS:
+        raise ValueError(f"unknown dataset {name!r}; see --list")
+    if timeframe not in TIMEFRAMES:
+        raise ValueError(f"timeframe must be one of {', '.join(TIMEFRAMES)}")
+    if end_date < start_date:
+        raise ValueError("end date is before start date")
+    loader, view, has_sources = DATASETS[name]
+    if sources and not has_sources:
+        raise ValueError(f"{name} has no source chains to filter on")
+    return _frames(loader, view, start_date, end_date, timeframe, tuple(sources), window_days)
+
+
+def _frames(loader, view, start_date, end_date, timeframe, sources, window_days):
+    def select(daily):
+        return daily[daily["SOURCE_CHAIN"].isin(sources)] if sources else daily
+
+    if view is _rows:
+        for window_start, window_end in day_windows(start_date, end_date, window_days):
+            yield select(loader(window_start, window_end))
+    else:
+        yield view(select(loader(start_date, end_date)), start_date, end_date, timeframe, sources)
+
+
+# --- Writers -----------------------------------------------------------------------------------------------------------------------
+def _export_type(arrow_type):
+    # One schema for every chunk, whatever categories and integer widths each window was compacted to.
+    if pa.types.is_dictionary(arrow_type):
+        return _export_type(arrow_type.value_type)
+    if pa.types.is_integer(arrow_type):
+        return pa.int64()
+    if pa.types.is_floating(arrow_type):
+        return pa.float64()
+    if pa.types.is_null(arrow_type):
+        return pa.string()
+    return arrow_type
+
+
+def _batches(frames, chunk_rows):
+    for frame in frames:
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        schema = pa.schema([pa.field(field.name, _export_type(field.type)) for field in table.schema])
+        yield from table.cast(schema).to_batches(max_chunksize=chunk_rows)
+
+
+class _JsonLinesWriter:
+    def __init__(self, sink):
+        self.sink = sink
+
+    def write_batch(self, batch):
+        rows = batch.to_pandas().to_json(orient="records", lines=True, date_format="iso")
+        self.sink.write(rows.encode("utf-8"))
+        if rows and not rows.endswith("\n"):
+            self.sink.write(b"\n")
+
+    def close(self):
+        pass
+
+
+def _writer(fmt, sink, schema):
+    if fmt == "parquet":
+        return pq.ParquetWriter(sink, schema, compression="zstd")
+    if fmt == "csv":
+        return pyarrow.csv.CSVWriter(sink, schema)
+    if fmt == "jsonl":
+        return _JsonLinesWriter(sink)
+    raise ValueError(f"format must be one of {', '.join(FORMATS)}")
+
+
+def write(frames, sink, fmt, chunk_rows=65536):
+    """Write ``frames`` to the binary file object ``sink`` as one ``fmt`` stream, batch by batch; returns the row count."""
+    writer = None
+    rows = 0
+    try:
+        for batch in _batches(frames, chunk_rows):
+            if writer is None:
+                writer = _writer(fmt, sink, batch.schema)
+            writer.write_batch(batch)
+            rows += batch.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+def export(name, sink, fmt, start_date, end_date, timeframe="day", sources=(), window_days=31):
+    return write(iter_frames(name, start_date, end_date, timeframe, sources, window_days), sink, fmt)
+
+
+# --- HTTP Endpoint -----------------------------------------------------------------------------------------------------------------
+class ExportHandler(BaseHTTPRequestHandler):
+    """``GET /datasets`` lists the dataset names; ``GET /export/<name>`` streams one.
+
+    Query parameters: ``start``, ``end`` (ISO dates), ``timeframe``, ``format``
+    and ``source_chain`` (repeatable), with the CLI's defaults.
+    """
+
+    protocol_version = "HTTP/1.0"
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == "/datasets":
+            self._reply(200, "application/json", json.dumps(sorted(DATASETS)).encode("utf-8"))
+            return
+        if not url.path.startswith("/export/"):
+            self._reply(404, "text/plain", b"not found\n")
+            return
+        query = parse_qs(url.query)
+
+        def param(key, default):
+            return query.get(key, [default])[0]
+
+        try:
+            fmt = param("format", "csv")
+            if fmt not in FORMATS:
+                raise ValueError(f"format must be one of {', '.join(FORMATS)}")
+            start_date = date.fromisoformat(param("start", DEFAULT_RANGE[0].isoformat()))
+            end_date = date.fromisoformat(param("end", DEFAULT_RANGE[1].isoformat()))
+            frames = iter_frames(
+                url.path.removeprefix("/export/"), start_date, end_date,
+                param("timeframe", "day"), query.get("source_chain", []),
+            )
+        except ValueError as exc:
+            self._reply(400, "text/plain", f"{exc}\n".encode("utf-8"))
+            return
+        try:
+            # Compute the first piece before answering, so a failed load still gets an error status.
+            first = next(frames, None)
+        except Exception:
+            logger.exception("Export %s failed", self.path)
+            self._reply(500, "text/plain", b"export failed\n")
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", FORMATS[fmt])
+        self.end_headers()
+        try:
+            write(itertools.chain([] if first is None else [first], frames), self.wfile, fmt)
+        except Exception:
+            # Headers are already sent; closing the connection early tells the client the body is incomplete.
+            logger.exception("Export %s failed while streaming", self.path)
+
+    def _reply(self, status, content_type, body):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def serve(host, port):
+    server = ThreadingHTTPServer((host, port), ExportHandler)
+    logger.info("Serving exports on http://%s:%d", host, port)
+    server.serve_forever()
+
+
+# --- Command Line ---------------------------------------------------------------------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export dashboard datasets as Parquet, CSV or JSON lines.")
+    parser.add_argument("dataset", nargs="?", help="Dataset name, see --list")
+    parser.add_argument("--list", action="store_true", help="List the dataset names and exit")
+    parser.add_argument("--start", type=date.fromisoformat, default=DEFAULT_RANGE[0], help="First day (ISO date)")
+    parser.add_argument("--end", type=date.fromisoformat, default=DEFAULT_RANGE[1], help="Last day (ISO date)")
+    parser.add_argument("--range", type=parse_range, default=None, help="START:END, instead of --start/--end")
+    parser.add_argument("--timeframe", choices=TIMEFRAMES, default="day", help="Bucket for the over-time views")
+    parser.add_argument("--source-chain", action="append", default=[], help="Only these source chains; repeatable")
+    parser.add_argument("--format", choices=list(FORMATS), default=None, help="Default: from --output's suffix, else csv")
+    parser.add_argument("-o", "--output", default=None, help="File to write (default: stdout)")
+    parser.add_argument("--window-days", type=int, default=31, help="Days loaded at a time for .daily datasets")
+    parser.add_argument("--serve", default=None, metavar="HOST:PORT", help="Run the HTTP endpoint instead")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s", stream=sys.stderr)
+    # Span records are logged as JSON by profiling.py; keep them out of the CLI's output.
+    logging.getLogger("axelar_dashboard.profiling").setLevel(logging.WARNING)
+
+    if args.list:
+        print("\n".join(sorted(DATASETS)))
+        return 0
+    if args.serve:
+        host, _, port = args.serve.rpartition(":")
+        serve(host or "127.0.0.1", int(port))
+        return 0
+    if not args.dataset:
+        parser.error("a dataset name is required (see --list)")
+
+    start_date, end_date = args.range or (args.start, args.end)
+    fmt = args.format or next((f for f in FORMATS if (args.output or "").endswith(f".{f}")), "csv")
+    try:
+        frames = iter_frames(args.dataset, start_date, end_date, args.timeframe, args.source_chain, args.window_days)
+    except ValueError as exc:
+        parser.error(str(exc))
+    if args.output:
+        with open(args.output, "wb") as sink:
+            rows = write(frames, sink, fmt)
+    else:
+        rows = write(frames, sys.stdout.buffer, fmt)
+    logger.info("Exported %d rows of %s %s..%s", rows, args.dataset, start_date, end_date)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""Figure builders for the page sections.
+
+Sections draw them through charts.cached_figure: a chart whose input frame is
+unchanged since any earlier rerun (in any session) is reused as built, and large
+ones are downsampled and drawn with WebGL.
+"""
+import plotly.express as px
+import plotly.graph_objects as go
+
+
+def txn_status_bars(txn_df):
+    # Stacked bar chart
+    return px.bar(
+        txn_df,
+        x="Date",
+        y="Number of Txns",
+        color="Status",
+        title="Successful & Failed Transactions Over Time",
+        barmode="stack"
+    )
+
+
+def txn_status_share_bars(txn_df):
+    # --- Normalized stacked bar chart (100% per Date) -------------------------------
+    totals_by_date = txn_df.groupby("Date")["Number of Txns"].transform("sum")
+    txn_df_pct = txn_df.copy()
+    txn_df_pct["Share"] = (txn_df_pct["Number of Txns"] / totals_by_date).fillna(0)
+
+    fig = px.bar(
+        txn_df_pct,
+        x="Date",
+        y="Share",
+        color="Status",
+        title="% of Successful & Failed Transactions Over Time",
+        barmode="stack"
+    )
+    fig.update_layout(
+        yaxis=dict(title="Percentage", tickformat=".0%", range=[0, 1])
+    )
+    return fig
+
+
+def users_figure(users_df):
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=users_df["Date"],
+        y=users_df["Number of Users"],
+        name="Number of Users",
+        yaxis="y1"
+    ))
+    fig.add_trace(go.Scatter(
+        x=users_df["Date"],
+        y=users_df["Avg Txn per User"],
+        name="Avg Txn per User",
+        mode="lines+markers",
+        yaxis="y2"
+    ))
+    fig.update_layout(
+        title="Axelar Users Over Time",
+        yaxis=dict(title="Number of Users", side="left"),
+        yaxis2=dict(title="Avg Txn per User", overlaying="y", side="right")
+    )
+    return fig
+
+
+def status_pie(status_pie_df):
+    # Pie chart
+    return px.pie(
+        status_pie_df,
+        names="Status",
+        values="Number of Txns",
+        title="Total Number of Transactions by Status",
+        hole=0.4
+    )
+
+
+def time_series_bars(df, x, y, title, labels, yaxis_title=None, color=None):
+    fig = px.bar(
+        df,
+        x=x,
+        y=y,
+        title=title,
+        labels=dict(labels),
+        color_discrete_sequence=[color] if color else None
+    )
+    if yaxis_title:
+        fig.update_layout(xaxis_title="", yaxis_title=yaxis_title, bargap=0.2)
+    return fig
+
+
+def source_dest_bubbles(src_dest_df, size):
+    return px.scatter(
+        src_dest_df,
+        x="Source Chain",
+        y="Destination Chain",
+        size=size,
+        color="Source Chain",
+        hover_data=["Volume (USD)", "Number of Transactions"],
+        title=f"Source Chain → Destination Chain: {size}"
+    )
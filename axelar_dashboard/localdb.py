@@ -0,0 +1,143 @@
+"""DuckDB stand-in for a Snowflake connection.
+
+The dashboard's SQL is written for Snowflake.  ``to_duckdb`` rewrites the few
+Snowflake-only constructs it uses (VARIANT paths, OBJECT_CONSTRUCT, TRY_TO_DOUBLE,
+HLL states, pyformat binds) so the same loaders run against a local DuckDB
+database whose file is named ``axelar.duckdb`` and holds the
+core/axelscan/defi schemas.
+``DuckDBConnection`` exposes the part of the connector API that
+``ConnectionPool`` and ``read_frame`` use; ``setup`` statements can instead
+build that layout in memory, e.g. as views over Parquet files.
+"""
+import itertools
+import re
+import threading
+
+import duckdb
+import pyarrow as pa
+
+from axelar_dashboard.sketch import HllSketch
+
+# A VARIANT path such as data:send:amount or data:call.transaction.from (but not ts::date or '00:00:00').
+_PATH = r"\b([A-Za-z_]\w*)((?::[A-Za-z_][\w.]*)+)"
+
+
+def _json_path(column, path):
+    return f"json_extract_string({column}, '$.{path[1:].replace(':', '.')}')"
+
+
+def _replace_double(match):
+    return f"TRY_CAST({_json_path(match.group(1), match.group(2))} AS DOUBLE)"
+
+
+def _replace_string(match):
+    return _json_path(match.group(1), match.group(2))
+
+
+def _replace_variant(match):
+    return f"json_extract({match.group(1)}, '$.{match.group(2)[1:].replace(':', '.')}')"
+
+
+def to_duckdb(query, params=None):
+    """Rewrite a dashboard query and its pyformat params for DuckDB."""
+    query = re.sub(
+        rf"CASE WHEN IS_ARRAY\({_PATH}\) OR IS_OBJECT\(\1\2\) THEN NULL ELSE TRY_TO_DOUBLE\(\1\2::STRING\) END",
+        _replace_double,
+        query,
+    )
+    query = re.sub(rf"TRY_TO_DOUBLE\({_PATH}::STRING\)", _replace_double, query)
+    query = re.sub(rf"{_PATH}::STRING", _replace_string, query)
+    query = re.sub(_PATH, _replace_variant, query)
+    query = query.replace("OBJECT_CONSTRUCT(", "json_object(")
+    # DuckDB has no exportable HLL state: ship the distinct values and build the sketch locally.
+    query = re.sub(r"HLL_EXPORT\(HLL_ACCUMULATE\((\w+)\)\)", r"LIST(DISTINCT \1) FILTER (WHERE \1 IS NOT NULL)", query)
+    query = re.sub(r"%\((\w+)\)s", r"$\1", query)
+    return query, params
+
+
+def _sketch(values):
+    sketch = HllSketch()
+    for value in values or ():
+        sketch.add(value)
+    return sketch.to_export()
+
+
+def states_from_lists(table):
+    """Replace every list-typed column of ``table`` with HLL_EXPORT-style JSON states."""
+    for i, field in enumerate(table.schema):
+        if pa.types.is_list(field.type):
+            states = pa.array([_sketch(values) for values in table.column(i).to_pylist()], pa.string())
+            table = table.set_column(i, field.name, states)
+    return table
+
+
+# --- Connector Surface -----------------------------------------------------------------------------------------------------------
+class _Column:
+    def __init__(self, name):
+        self.name = name
+
+
+_executed = {"queries": 0}
+_executed_lock = threading.Lock()
+_query_ids = itertools.count(1)
+
+
+def queries_executed():
+    """Statements run through any DuckDBConnection in this process."""
+    return _executed["queries"]
+
+
+class DuckDBCursor:
+    def __init__(self, conn):
+        self._conn = conn
+        self.sfqid = None
+        self.description = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def execute(self, query, params=None):
+        query, params = to_duckdb(query, params)
+        result = self._conn.execute(query, params or {})
+        with _executed_lock:
+            _executed["queries"] += 1
+        self.sfqid = f"duckdb-{next(_query_ids)}"
+        self.description = [_Column(column[0]) for column in result.description or []]
+        return self
+
+    def fetch_arrow_all(self):
+        # Like the Snowflake connector, an empty result comes back as None.
+        table = states_from_lists(self._conn.fetch_record_batch().read_all())
+        return table if table.num_rows else None
+
+    def fetchall(self):
+        return self._conn.fetchall()
+
+    def interrupt(self):
+        self._conn.interrupt()
+
+    def close(self):
+        self._conn.close()
+
+
+class DuckDBConnection:
+    """One DuckDB connection that quacks like ``snowflake.connector`` for the pool."""
+
+    def __init__(self, database, read_only=True, setup=()):
+        self._conn = duckdb.connect(database, read_only=read_only)
+        for statement in setup:
+            self._conn.execute(statement)
+        self._closed = False
+
+    def cursor(self):
+        return DuckDBCursor(self._conn.cursor())
+
+    def is_closed(self):
+        return self._closed
+
+    def close(self):
+        self._closed = True
+        self._conn.close()
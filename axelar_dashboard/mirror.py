@@ -0,0 +1,200 @@
+"""Local Parquet mirror of the four source tables, queried with DuckDB.
+
+Sync it with::
+
+    python -m axelar_dashboard.mirror --since 2025-01-01
+
+The mirror lives under ``[mirror] path`` in the Streamlit secrets (or the
+``AXELAR_DASHBOARD_MIRROR`` environment variable) as one Parquet file per
+table and closed UTC day, holding only the columns (and ``data`` keys) the
+dashboard reads.  Loaders use it for every range it fully covers, see
+backends.py; anything else, including the open day, goes to Snowflake.
+"""
+import argparse
+import logging
+import os
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+import streamlit as st
+
+from axelar_dashboard.connection import read_frame
+from axelar_dashboard.queries import time_range
+from axelar_dashboard.store import DailyStore, utc_today
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class MirrorTable:
+    name: str  # fully qualified name the dashboard SQL uses
+    columns: tuple  # (column, Snowflake select expression, DuckDB type) triples
+    time_column: str
+    where: str = "TRUE"  # rows no dashboard query can read are left out
+
+    @property
+    def dataset(self):
+        return self.name.split(".")[-1].lower()
+
+
+def _object(*pairs):
+    # Rebuild a VARIANT with only the keys the dashboard reads, so the mirror keeps the same paths.
+    return "OBJECT_CONSTRUCT(" + ", ".join(f"'{key}', {value}" for key, value in pairs) + ")"
+
+
+_RECEIVED = "status = 'executed' AND simplified_status = 'received'"
+
+TABLES = (
+    MirrorTable(
+        name="axelar.core.fact_transactions",
+        columns=(
+            ("block_timestamp", "block_timestamp", "TIMESTAMP"),
+            ("tx_id", "tx_id", "VARCHAR"),
+            ("tx_from", "tx_from", "VARCHAR"),
+            ("tx_succeeded", "tx_succeeded", "BOOLEAN"),
+        ),
+        time_column="block_timestamp",
+    ),
+    MirrorTable(
+        name="axelar.axelscan.fact_transfers",
+        columns=(
+            ("created_at", "created_at", "TIMESTAMP"),
+            ("id", "id", "VARCHAR"),
+            ("status", "status", "VARCHAR"),
+            ("simplified_status", "simplified_status", "VARCHAR"),
+            ("sender_address", "sender_address", "VARCHAR"),
+            ("recipient_address", "recipient_address", "VARCHAR"),
+            ("data", _object(
+                ("send", _object(
+                    ("original_source_chain", "data:send:original_source_chain"),
+                    ("original_destination_chain", "data:send:original_destination_chain"),
+                    ("amount", "data:send:amount"),
+                    ("fee_value", "data:send:fee_value"),
+                )),
+                ("link", _object(("price", "data:link:price"))),
+            ), "VARCHAR"),
+        ),
+        time_column="created_at",
+        where=_RECEIVED,
+    ),
+    MirrorTable(
+        name="axelar.axelscan.fact_gmp",
+        columns=(
+            ("created_at", "created_at", "TIMESTAMP"),
+            ("id", "id", "VARCHAR"),
+            ("status", "status", "VARCHAR"),
+            ("simplified_status", "simplified_status", "VARCHAR"),
+            ("data", _object(
+                ("call", _object(
+                    ("chain", "data:call.chain"),
+                    ("returnValues", _object(("destinationChain", "data:call.returnValues.destinationChain"))),
+                    ("transaction", _object(("from", "data:call.transaction.from"))),
+                )),
+                ("value", "data:value"),
+                ("gas", _object(("gas_used_amount", "data:gas:gas_used_amount"))),
+                ("gas_price_rate", _object(("source_token", _object(("token_price", _object(
+                    ("usd", "data:gas_price_rate:source_token.token_price.usd"),
+                )))))),
+                ("fees", _object(("express_fee_usd", "data:fees:express_fee_usd"))),
+                ("approved", _object(("returnValues", _object(
+                    ("contractAddress", "data:approved:returnValues:contractAddress"),
+                )))),
+            ), "VARCHAR"),
+        ),
+        time_column="created_at",
+        where=_RECEIVED,
+    ),
+    MirrorTable(
+        name="axelar.defi.ez_bridge_satellite",
+        columns=(
+            ("block_timestamp", "block_timestamp", "TIMESTAMP"),
+            ("tx_hash", "tx_hash", "VARCHAR"),
+            ("source_chain", "source_chain", "VARCHAR"),
+            ("destination_chain", "destination_chain", "VARCHAR"),
+            ("sender", "sender", "VARCHAR"),
+        ),
+        time_column="block_timestamp",
+    ),
+)
+
+
+# --- Serving ---------------------------------------------------------------------------------------------------------------------
+def view_statements(root, tables=TABLES):
+    """DuckDB statements that expose the mirror under the same names as the Snowflake tables."""
+    statements = ["ATTACH ':memory:' AS axelar"]
+    for schema in sorted({table.name.split(".")[1] for table in tables}):
+        statements.append(f"CREATE SCHEMA axelar.{schema}")
+    for table in tables:
+        columns = ", ".join(f"CAST({name} AS {type_}) AS {name}" for name, _, type_ in table.columns)
+        files = os.path.join(os.path.abspath(root), table.dataset, "*.parquet").replace("'", "''")
+        statements.append(f"CREATE VIEW {table.name} AS SELECT {columns} FROM read_parquet('{files}', union_by_name = true)")
+    return statements
+
+
+def covers(store, start_date, end_date, tables=TABLES):
+    """True when every table has a file for every day of the range; the open day never qualifies."""
+    if end_date >= utc_today():
+        return False
+    return all(not store.missing_days(table.dataset, start_date, end_date) for table in tables)
+
+
+# --- Sync ------------------------------------------------------------------------------------------------------------------------
+def fetch_query(table):
+    select = ", ".join(expr if expr == name else f"{expr} AS {name}" for name, expr, _ in table.columns)
+    return f"SELECT {select} FROM {table.name} WHERE {time_range(table.time_column)} AND {table.where}"
+
+
+def sync(store, since, until=None, overlap=timedelta(days=2), chunk=timedelta(days=7), tables=TABLES, read=read_frame):
+    """Mirror every closed day in [since, until] that is not on disk yet.
+
+    The last ``overlap`` days are always re-fetched so rows that arrive late or change
+    status are picked up.  Each query covers at most ``chunk`` days to bound memory.
+    """
+    until = min(until or utc_today(), utc_today() - timedelta(days=1))
+    for table in tables:
+        for day in (until - timedelta(days=i) for i in range(overlap.days)):
+            if store.has(table.dataset, day):
+                os.remove(store.path(table.dataset, day))
+        query = fetch_query(table)
+
+        def fetch(first, last, query=query):
+            df = read(query, {"start": first.isoformat(), "end": (last + timedelta(days=1)).isoformat()})
+            logger.info("Mirrored %s %s..%s: %d rows", table.name, first, last, len(df))
+            return df
+
+        first = since
+        while first <= until:
+            last = min(first + chunk - timedelta(days=1), until)
+            store.fill(table.dataset, first, last, fetch, day_column=table.time_column)
+            first = last + timedelta(days=1)
+
+
+def mirror_root():
+    return os.environ.get("AXELAR_DASHBOARD_MIRROR") or st.secrets.get("mirror", {}).get("path")
+
+
+# --- Command Line ---------------------------------------------------------------------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mirror the dashboard's source columns into local Parquet files.")
+    parser.add_argument("--root", default=None, help="Mirror directory (default: [mirror] path in secrets)")
+    parser.add_argument("--since", default="2025-01-01", help="First day to mirror")
+    parser.add_argument("--until", default=None, help="Last day to mirror (default: yesterday, UTC)")
+    parser.add_argument("--overlap-days", type=int, default=2, help="Trailing days to re-fetch every run")
+    parser.add_argument("--chunk-days", type=int, default=7, help="Days per Snowflake query")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    root = args.root or mirror_root()
+    if not root:
+        parser.error("no root given and [mirror] path is not set in secrets")
+    sync(
+        DailyStore(root),
+        date.fromisoformat(args.since),
+        date.fromisoformat(args.until) if args.until else None,
+        timedelta(days=args.overlap_days),
+        timedelta(days=args.chunk_days),
+    )
+
+
+if __name__ == "__main__":
+    main()
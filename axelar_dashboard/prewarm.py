@@ -0,0 +1,131 @@
+"""Headless cache pre-warmer for deploys and scheduled refreshes.
+
+    python -m axelar_dashboard.prewarm                      # the page's default range
+    python -m axelar_dashboard.prewarm --preset default --preset last-30 --range 2024-06-01:2024-12-31
+    python -m axelar_dashboard.prewarm --every-minutes 60   # keep running, once an hour
+
+Runs the section loaders for every preset range on the shared worker pool,
+without starting the UI.  Settled days land in the local day store (see
+store.py), which every dashboard process on the host reads, so the first
+visitor after a deploy only waits for the last few days, which are always
+re-fetched because late rows can still change them.  Loaders work at day grain
+and the page rolls them up by timeframe locally, so one run per range serves
+every timeframe.
+
+To have each newly settled day stored before anyone asks for it, schedule a run
+just after the UTC day rolls over, e.g. from cron::
+
+    5 0 * * * cd /srv/axelar-dashboard && python -m axelar_dashboard.prewarm --preset default --preset last-30
+
+Exits non-zero if any loader failed.
+"""
+import argparse
+import contextvars
+import logging
+import sys
+import time
+from datetime import date, timedelta
+
+from axelar_dashboard import core, satellite, squid
+from axelar_dashboard.executor import PRIORITY_HIGH, PRIORITY_LOW, PRIORITY_NORMAL, get_executor
+from axelar_dashboard.profiling import start_profile
+from axelar_dashboard.store import utc_today
+
+logger = logging.getLogger(__name__)
+
+# Same order and priorities as the page submits them.
+SECTIONS = {
+    "core": (core.load_core_daily, PRIORITY_HIGH),
+    "squid": (squid.load_squid_daily, PRIORITY_NORMAL),
+    "satellite": (satellite.load_satellite_daily, PRIORITY_LOW),
+}
+
+# Main_Dashboard.py's default Start/End Date.
+DEFAULT_RANGE = (date(2025, 1, 1), date(2025, 8, 31))
+
+
+def preset_range(name, today=None):
+    """``default`` or ``last-N`` (the N days up to and including today, UTC)."""
+    today = today or utc_today()
+    if name == "default":
+        return DEFAULT_RANGE
+    if name.startswith("last-") and name[5:].isdigit():
+        return today - timedelta(days=int(name[5:]) - 1), today
+    raise ValueError(f"unknown preset {name!r}; expected 'default' or 'last-<days>'")
+
+
+def parse_range(text):
+    start, _, end = text.partition(":")
+    return date.fromisoformat(start), date.fromisoformat(end)
+
+
+def _warm(section, loader, start_date, end_date):
+    profile = start_profile()
+    started = time.perf_counter()
+    rows = len(loader(start_date, end_date))
+    records = profile.records
+    return {
+        "section": section,
+        "range": f"{start_date}..{end_date}",
+        "rows": rows,
+        "seconds": round(time.perf_counter() - started, 2),
+        "queries": sum(record["kind"] == "query" for record in records),
+    }
+
+
+def prewarm(ranges, sections=tuple(SECTIONS)):
+    """Load every section for every range concurrently; returns one summary dict per (range, section)."""
+    executor = get_executor()
+    futures = []
+    for start_date, end_date in ranges:
+        for section in sections:
+            loader, priority = SECTIONS[section]
+            # Each task runs in its own context so its profile only sees its own spans.
+            task = contextvars.copy_context().run
+            futures.append((section, start_date, end_date, executor.submit(
+                task, _warm, section, loader, start_date, end_date, priority=priority
+            )))
+
+    results = []
+    for section, start_date, end_date, future in futures:
+        try:
+            result = future.result()
+        except Exception as exc:
+            logger.exception("Pre-warming %s %s..%s failed", section, start_date, end_date)
+            result = {"section": section, "range": f"{start_date}..{end_date}", "error": repr(exc)}
+        else:
+            logger.info("Warmed %(section)s %(range)s: %(rows)d rows in %(seconds).2fs, %(queries)d queries", result)
+        results.append(result)
+    return results
+
+
+# --- Command Line ---------------------------------------------------------------------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Populate the dashboard's caches for preset date ranges.")
+    parser.add_argument("--preset", action="append", default=[], help="'default' or 'last-<days>'; repeatable")
+    parser.add_argument("--range", action="append", default=[], type=parse_range, help="START:END in ISO dates; repeatable")
+    parser.add_argument("--section", action="append", choices=list(SECTIONS), help="Sections to warm (default: all)")
+    parser.add_argument("--every-minutes", type=float, default=None, help="Repeat forever at this interval")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    # Span records are logged as JSON by profiling.py; keep them out of the CLI's output.
+    logging.getLogger("axelar_dashboard.profiling").setLevel(logging.WARNING)
+
+    presets = args.preset or ([] if args.range else ["default"])
+    for name in presets:
+        try:
+            preset_range(name)
+        except ValueError as exc:
+            parser.error(str(exc))
+    while True:
+        # Presets are resolved per run, so rolling ranges follow the UTC day.
+        ranges = [preset_range(name) for name in presets] + args.range
+        results = prewarm(ranges, args.section or tuple(SECTIONS))
+        failed = [result for result in results if "error" in result]
+        if args.every_minutes is None:
+            return 1 if failed else 0
+        time.sleep(args.every_minutes * 60)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+import contextvars
+import itertools
+import json
+import logging
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+logger = logging.getLogger(__name__)
+
+_profile = contextvars.ContextVar("axelar_dashboard_profile", default=None)
+_open_span = contextvars.ContextVar("axelar_dashboard_span", default=None)
+_reruns = itertools.count()
+
+
+class Profile:
+    """Timing records for one rerun: loaders, warehouse queries and chart builds.
+
+    Every finished span is also logged as one JSON line, so the same numbers are
+    in the server logs whether or not anyone opens the debug panel.
+    """
+
+    def __init__(self, started=None, parent=None):
+        self.run_id = uuid.uuid4().hex[:12]
+        # A fragment rerun's profile names the page rerun that drew the rest of the page.
+        self.parent_run_id = parent.run_id if parent is not None else None
+        self.started = started or time.perf_counter()
+        # The process's first rerun pays for every import; later ones find the modules loaded.
+        self.cold = next(_reruns) == 0
+        self.records = []
+        self._lock = threading.Lock()
+
+    def add(self, record):
+        with self._lock:
+            self.records.append(record)
+        entry = {"run_id": self.run_id, **record}
+        if self.parent_run_id is not None:
+            entry["parent_run_id"] = self.parent_run_id
+        logger.info(json.dumps(entry, default=str))
+
+    def mark(self, name, kind="startup"):
+        """Record how long the rerun took to reach this point, e.g. its first paint."""
+        self.add({
+            "section": None, "name": name, "kind": kind, "cold": self.cold,
+            "start_ms": 0.0, "wall_ms": round((time.perf_counter() - self.started) * 1000, 1),
+            "thread": threading.current_thread().name,
+        })
+
+    def frame(self):
+        import pandas as pd
+
+        return pd.DataFrame(self.records)
+
+
+def log_spans():
+    """Log every span record as one JSON line on stderr, which the server logs capture.
+
+    Streamlit configures only its own loggers, so the app's entry point calls this;
+    CLIs leave it out or raise this logger's level.
+    """
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+
+
+def start_profile(started=None, parent=None):
+    """Begin a new profile for this rerun; worker threads inherit it through their copied context.
+
+    ``started`` (a ``time.perf_counter()`` value) backdates it, e.g. to the top of the script.
+    """
+    profile = Profile(started, parent)
+    _profile.set(profile)
+    return profile
+
+
+def start_fragment_profile():
+    """Begin a child profile when an ``st.fragment`` reruns on its own; in a page rerun, keep the page's.
+
+    The script thread keeps its context between reruns, so without this a fragment
+    rerun's spans would land in the last page rerun's profile, timed from its start.
+    """
+    ctx = get_script_run_ctx(suppress_warning=True)
+    if ctx is None or not ctx.fragment_ids_this_run:
+        return _profile.get()
+    return start_profile(parent=_profile.get())
+
+
+@contextmanager
+def span(name, kind, section=None):
+    """Time the enclosed block and record it in the current rerun's profile.
+
+    ``section`` defaults to the enclosing span's, so queries issued inside a
+    loader are attributed to that loader's section.  Yields the record; code in
+    the block (or below it, via ``annotate``) can add fields such as rows or
+    query_id.  Outside a profiled rerun the record is discarded.
+    """
+    parent = _open_span.get()
+    record = {"section": section or (parent or {}).get("section"), "name": name, "kind": kind}
+    token = _open_span.set(record)
+    start = time.perf_counter()
+    try:
+        yield record
+    except Exception as exc:
+        record["error"] = repr(exc)
+        raise
+    finally:
+        end = time.perf_counter()
+        _open_span.reset(token)
+        profile = _profile.get()
+        if profile is not None:
+            record.update(
+                start_ms=round((start - profile.started) * 1000, 1),
+                wall_ms=round((end - start) * 1000, 1),
+                thread=threading.current_thread().name,
+            )
+            profile.add(record)
+
+
+def annotate(**fields):
+    """Add fields to the innermost open span, if any."""
+    record = _open_span.get()
+    if record is not None:
+        record.update(fields)
+
+
+# --- Debug Panel -----------------------------------------------------------------------------------------------------------------
+def is_admin():
+    """True when ``?debug=<token>`` matches ``[admin] debug_token`` in secrets; never true without a token."""
+    token = st.secrets.get("admin", {}).get("debug_token")
+    return bool(token) and st.query_params.get("debug") == token
+
+
+def _bytes_scanned(query_ids):
+    # Query history is only readable after the fact and with some lag, so it is looked up
+    # when the panel is drawn instead of on every query.
+    from axelar_dashboard.connection import get_pool
+
+    ids = ", ".join(f"'{query_id}'" for query_id in query_ids)
+
+    def fetch(conn):
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT query_id, bytes_scanned "
+                "FROM TABLE(INFORMATION_SCHEMA.QUERY_HISTORY_BY_USER(RESULT_LIMIT => 1000)) "
+                f"WHERE query_id IN ({ids})"
+            )
+            return dict(cur.fetchall())
+
+    try:
+        return get_pool().run(fetch)
+    except Exception:
+        logger.exception("Could not read bytes scanned from query history")
+        return {}
+
+
+def render_panel(profile, metrics=None):
+    """Per-section waterfall and the raw records of ``profile``, in a collapsed expander.
+
+    ``metrics`` are process-wide counters (e.g. the range cache's) shown alongside.
+    """
+    import plotly.express as px
+
+    with st.expander("🛠️ Performance (admin)", expanded=False):
+        if metrics:
+            st.write("Process-wide counters:", metrics)
+        df = profile.frame()
+        if df.empty:
+            st.write("Nothing was recorded in this rerun.")
+            return
+        if "query_id" in df:
+            query_ids = df["query_id"].dropna().tolist()
+            if query_ids:
+                df["bytes_scanned"] = df["query_id"].map(_bytes_scanned(query_ids))
+
+        df["section"] = df["section"].fillna("page")
+        df["label"] = df["section"] + " · " + df["name"]
+        fig = px.bar(
+            df.sort_values("start_ms"),
+            base="start_ms",
+            x="wall_ms",
+            y="label",
+            color="section",
+            orientation="h",
+            hover_data=[c for c in ("kind", "cache", "rows", "query_id", "bytes_scanned") if c in df],
+            title=f"Rerun {profile.run_id}: where the time went (ms)",
+        )
+        fig.update_yaxes(autorange="reversed", title="")
+        fig.update_layout(xaxis_title="ms since rerun start")
+        st.plotly_chart(fig, use_container_width=True)
+
+        totals = df[df["kind"] == "loader"].groupby("section")["wall_ms"].sum()
+        st.write("Loader wall time by section (ms):", totals.to_dict())
+        st.dataframe(df.drop(columns=["label"]), use_container_width=True)
@@ -0,0 +1,173 @@
+from dataclasses import dataclass
+from datetime import timedelta
+
+# --- Squid Router contracts -----------------------------------------------------------------------------------------------------
+SQUID_CONTRACTS = (
+    "0xce16f69375520ab01377ce7b88f5ba8c48f8d666",
+    "0x492751ec3c57141deb205ec2da8bfcb410738630",
+    "0xdc3d8e1abe590bca428a8a2fc4cfdbd1acf57bd9",
+    "0xdf4ffda22270c12d0b5b3788f1669d709476111e",
+    "0xe6b3949f9bbf168f4e3efc82bc8fd849868cc6d8",
+)
+_SQUID_CONTRACT_LIST = ", ".join(f"'{address}'" for address in SQUID_CONTRACTS)
+
+
+def time_range(column):
+    """Range predicate on the raw timestamp column, so Snowflake can prune micro-partitions."""
+    return f"{column} >= %(start)s AND {column} < %(end)s"
+
+
+def range_params(start_date, end_date):
+    return {"start": start_date.isoformat(), "end": (end_date + timedelta(days=1)).isoformat()}
+
+
+def _double(path):
+    # Scalar VARIANT -> DOUBLE; arrays and objects become NULL.
+    return f"CASE WHEN IS_ARRAY({path}) OR IS_OBJECT({path}) THEN NULL ELSE TRY_TO_DOUBLE({path}::STRING) END"
+
+
+# --- Fact Sources -----------------------------------------------------------------------------------------------------------------
+# Each source is a CTE body that exposes normalized column names (ts, user, source_chain, ...), so
+# every metric below is written once against those names.
+CORE_FACTS = f"""
+    SELECT block_timestamp AS ts, tx_id, tx_from AS user,
+           CASE WHEN tx_succeeded = 'TRUE' THEN 'Succeeded' ELSE 'Failed' END AS status
+    FROM axelar.core.fact_transactions
+    WHERE {time_range("block_timestamp")}
+"""
+
+SQUID_FACTS = f"""
+    -- Token Transfers
+    SELECT created_at AS ts,
+           LOWER(data:send:original_source_chain::STRING) AS source_chain,
+           LOWER(data:send:original_destination_chain::STRING) AS destination_chain,
+           recipient_address AS user,
+           {_double("data:send:amount")} * {_double("data:link:price")} AS amount_usd,
+           {_double("data:send:fee_value")} AS fee,
+           id, SPLIT_PART(id, '_', 1) AS tx_hash, 'Token Transfers' AS service
+    FROM axelar.axelscan.fact_transfers
+    WHERE status = 'executed'
+      AND simplified_status = 'received'
+      AND {time_range("created_at")}
+      AND LOWER(sender_address) IN ({_SQUID_CONTRACT_LIST})
+
+    UNION ALL
+
+    -- GMP
+    SELECT created_at AS ts,
+           LOWER(data:call.chain::STRING) AS source_chain,
+           LOWER(data:call.returnValues.destinationChain::STRING) AS destination_chain,
+           data:call.transaction.from::STRING AS user,
+           {_double("data:value")} AS amount_usd,
+           COALESCE({_double("data:gas:gas_used_amount")} * {_double("data:gas_price_rate:source_token.token_price.usd")},
+                    {_double("data:fees:express_fee_usd")}) AS fee,
+           id, SPLIT_PART(id, '_', 1) AS tx_hash, 'GMP' AS service
+    FROM axelar.axelscan.fact_gmp
+    WHERE status = 'executed'
+      AND simplified_status = 'received'
+      AND {time_range("created_at")}
+      AND LOWER(data:approved:returnValues:contractAddress::STRING) IN ({_SQUID_CONTRACT_LIST})
+"""
+
+SATELLITE_TRANSFERS = f"""
+    SELECT created_at,
+           SPLIT_PART(id, '_', 1) AS tx_hash,
+           TRY_TO_DOUBLE(data:send:amount::STRING) * TRY_TO_DOUBLE(data:link:price::STRING) AS amount_usd
+    FROM axelar.axelscan.fact_transfers
+    WHERE status = 'executed' AND simplified_status = 'received'
+      AND {time_range("created_at")}
+"""
+
+
+def satellite_facts(transfers):
+    """Satellite bridge rows joined to the USD amount of their transfer, read from ``transfers``."""
+    return f"""
+    WITH satellite AS (
+        SELECT block_timestamp, tx_hash, source_chain, destination_chain, sender
+        FROM AXELAR.DEFI.EZ_BRIDGE_SATELLITE
+        WHERE {time_range("block_timestamp")}
+    ),
+    transfers AS ({transfers})
+    SELECT satellite.block_timestamp AS ts, satellite.tx_hash, satellite.source_chain, satellite.destination_chain,
+           satellite.sender, transfers.amount_usd,
+           -- One row per tx_hash, a priced one if any, so transaction counts summed across groups count it once.
+           ROW_NUMBER() OVER (
+               PARTITION BY satellite.tx_hash
+               ORDER BY satellite.block_timestamp, satellite.source_chain, satellite.destination_chain, satellite.sender,
+                        transfers.amount_usd IS NULL
+           ) = 1 AS first_of_tx
+    FROM satellite LEFT JOIN transfers ON satellite.tx_hash = transfers.tx_hash
+"""
+
+
+SATELLITE_FACTS = satellite_facts(SATELLITE_TRANSFERS)
+
+
+# --- Metric Specs -----------------------------------------------------------------------------------------------------------------
+@dataclass(frozen=True)
+class DailySpec:
+    name: str
+    facts: str
+    dimensions: tuple  # (column alias, expression) pairs after DAY
+    metrics: tuple  # (column alias, aggregate expression) pairs
+    categories: tuple = ()
+    version: int = 1  # bump when the metrics change, so days already in the day store are recomputed
+
+    @property
+    def dataset(self):
+        """Name of the spec's rows in the day store."""
+        return self.name if self.version == 1 else f"{self.name}-v{self.version}"
+
+
+CORE_DAILY = DailySpec(
+    name="core",
+    facts=CORE_FACTS,
+    dimensions=(("STATUS", "status"),),
+    metrics=(
+        ("N_TXNS", "COUNT(DISTINCT tx_id)"),
+        ("USERS_HLL", "HLL_EXPORT(HLL_ACCUMULATE(user))"),
+    ),
+    categories=("STATUS",),
+)
+
+SQUID_DAILY = DailySpec(
+    name="squid",
+    facts=SQUID_FACTS,
+    dimensions=(("SOURCE_CHAIN", "source_chain"), ("DESTINATION_CHAIN", "destination_chain")),
+    metrics=(
+        ("N_TRANSFERS", "COUNT(DISTINCT id)"),
+        ("N_PRICED_TRANSFERS", "COUNT(DISTINCT CASE WHEN amount_usd IS NOT NULL THEN id END)"),
+        ("VOLUME_USD", "SUM(amount_usd)"),
+        ("USERS_HLL", "HLL_EXPORT(HLL_ACCUMULATE(user))"),
+    ),
+    categories=("SOURCE_CHAIN", "DESTINATION_CHAIN"),
+)
+
+SATELLITE_DAILY = DailySpec(
+    name="satellite",
+    facts=SATELLITE_FACTS,
+    dimensions=(("SOURCE_CHAIN", "source_chain"), ("DESTINATION_CHAIN", "destination_chain"), ("SENDER", "sender")),
+    metrics=(
+        ("N_TXNS", "COUNT(DISTINCT CASE WHEN first_of_tx THEN tx_hash END)"),
+        ("N_PRICED_TXNS", "COUNT(DISTINCT CASE WHEN first_of_tx AND amount_usd IS NOT NULL THEN tx_hash END)"),
+        # Every joined row, like the original dashboard: a tx_hash with several transfers sums all of them.
+        ("VOLUME_USD", "SUM(amount_usd)"),
+    ),
+    categories=("SOURCE_CHAIN", "DESTINATION_CHAIN"),
+    version=3,
+)
+
+
+def build_daily_query(spec, start_date, end_date, facts=None):
+    """Render ``spec`` as one GROUP BY over its fact CTE.
+
+    The template depends only on the spec and the range is passed as bind
+    parameters, so the same spec and range always produce byte-identical SQL and
+    Snowflake's result cache can answer repeats from any session or replica.
+    ``facts`` replaces the spec's fact CTE, e.g. with one that reads a staging table.
+    """
+    columns = [("DAY", "ts::date"), *spec.dimensions]
+    select = ",\n    ".join(f"{expr} AS {alias}" for alias, expr in columns + list(spec.metrics))
+    group_by = ", ".join(str(i + 1) for i in range(len(columns)))
+    query = f"WITH facts AS ({facts or spec.facts})\nSELECT\n    {select}\nFROM facts\nGROUP BY {group_by}"
+    return query, range_params(start_date, end_date)
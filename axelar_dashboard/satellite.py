@@ -0,0 +1,86 @@
+import pandas as pd
+
+from axelar_dashboard.aggregate import round_sum, truncate
+from axelar_dashboard.cache import range_cache
+from axelar_dashboard.cube import get_cube, pair_totals
+from axelar_dashboard.daily import daily_source, load_daily
+from axelar_dashboard.dtypes import compact_frame
+from axelar_dashboard.queries import SATELLITE_DAILY
+from axelar_dashboard.sketch import distinct_count
+from axelar_dashboard.store import get_store
+from axelar_dashboard.streaming import StreamingAggregate
+
+
+# --- Satellite Facts: one join per date range -------------------------------------------------------------------------------
+# EZ_BRIDGE_SATELLITE joined to fact_transfers is the slowest query on the page, so it runs once per
+# range at (day, source, destination, sender) grain and the KPI row, the time series and the
+# chain-pair bubbles are all computed from that frame.
+def _cube():
+    return get_cube("satellite", ("N_PRICED_TXNS", "VOLUME_USD"), priced="N_PRICED_TXNS")
+
+
+# Sender rows grow with the range; past this many days the range is folded into (day, source, destination)
+# rows one window at a time, with senders as HLL states like the Squid and core users. User counts are then
+# estimates, and peak memory is one window of senders plus the folded rows (see streaming.py).
+STREAM_AFTER_DAYS = 366
+SUMS = ("N_TXNS", "N_PRICED_TXNS", "VOLUME_USD")
+
+
+def _fold_satellite_daily(start_date, end_date):
+    dataset, fetch = daily_source(SATELLITE_DAILY, start_date, end_date)
+    with StreamingAggregate(
+        ("DAY", "SOURCE_CHAIN", "DESTINATION_CHAIN"), sums=SUMS, build_sketches={"USERS_HLL": "SENDER"}
+    ) as rollup:
+        for first, last, window in get_store().iter_range(dataset, start_date, end_date, fetch):
+            _cube().add(window, first, last)
+            rollup.add(window)
+        return compact_frame(rollup.result(), SATELLITE_DAILY.categories)
+
+
+@range_cache
+def load_satellite_daily(start_date, end_date):
+    if (end_date - start_date).days + 1 > STREAM_AFTER_DAYS:
+        return _fold_satellite_daily(start_date, end_date)
+    daily = load_daily(SATELLITE_DAILY, start_date, end_date)
+    _cube().add(daily, start_date, end_date)
+    return daily
+
+
+# --- Derived Views -----------------------------------------------------------------------------------------------------------
+# Frames of ranges up to STREAM_AFTER_DAYS list senders (exact users); folded ones carry USERS_HLL states.
+def users_estimated(daily):
+    """True when the user counts of ``daily`` are HLL estimates, which the page labels as such."""
+    return "USERS_HLL" in daily
+
+
+def _users(rows):
+    return distinct_count(rows["USERS_HLL"]) if "USERS_HLL" in rows else rows["SENDER"].nunique()
+
+
+def satellite_kpi(daily):
+    return pd.DataFrame({
+        "Transactions": [int(daily["N_TXNS"].sum())],
+        "Users": [_users(daily)],
+        "Volume (USD)": [round_sum(daily["VOLUME_USD"])],
+    })
+
+
+def satellite_over_time(daily, timeframe):
+    grouped = daily.groupby(truncate(daily["DAY"], timeframe).rename("Date"))
+    return pd.DataFrame({
+        "Transactions": grouped["N_TXNS"].sum(),
+        "Users": grouped["USERS_HLL"].agg(distinct_count) if "USERS_HLL" in daily else grouped["SENDER"].nunique(),
+        "Volume (USD)": grouped["VOLUME_USD"].agg(round_sum),
+    }).reset_index().sort_values("Date")
+
+
+def satellite_src_dest(daily, start_date, end_date, sources=()):
+    # ``daily`` is the range's frame after the section's source-chain filter, whose choice is ``sources``.
+    totals = pair_totals(_cube(), daily, start_date, end_date, sources)
+    df = pd.DataFrame({
+        "Source Chain": totals["SOURCE_CHAIN"],
+        "Destination Chain": totals["DESTINATION_CHAIN"],
+        "Number of Transactions": totals["N_PRICED_TXNS"],
+        "Volume (USD)": totals["VOLUME_USD"].round(),
+    })
+    return df.sort_values(["Number of Transactions", "Volume (USD)"], ascending=[False, True], ignore_index=True)
@@ -0,0 +1,74 @@
+"""Page sections, one module each, exposing an ``st.fragment`` ``render(queries, timeframe, start_date, end_date)``.
+
+Section modules, and with them pandas, Plotly and the data modules, are
+imported on first render, after the page has painted its header, filters and
+loading placeholders.  Loaders are referenced lazily too, so their imports
+(Snowflake connector included) happen on the worker thread that first runs one.
+"""
+import importlib
+
+import streamlit as st
+
+SECTIONS = ("core", "squid", "satellite")
+
+
+def lazy(module, attribute):
+    """``module.attribute`` as a callable that imports ``module`` when first called."""
+    def call(*args, **kwargs):
+        return getattr(importlib.import_module(module), attribute)(*args, **kwargs)
+    call.__name__ = attribute
+    return call
+
+
+LOADERS = {
+    "core": lazy("axelar_dashboard.core", "load_core_daily"),
+    "squid": lazy("axelar_dashboard.squid", "load_squid_daily"),
+    "satellite": lazy("axelar_dashboard.satellite", "load_satellite_daily"),
+}
+
+
+def render(name, queries, timeframe, start_date, end_date):
+    importlib.import_module(f"{__name__}.{name}").render(queries, timeframe, start_date, end_date)
+
+
+# --- Section-Local Filters ------------------------------------------------------------------------------------------------------------------------------
+# Each section's render() is an st.fragment: changing one of its own filters reruns that section only.
+def section_timeframe(key, default):
+    local = st.segmented_control(
+        "Section Time Frame", ["day", "week", "month"], key=key,
+        help="Overrides the page time frame for this section only."
+    )
+    return local or default
+
+
+def source_chain_filter(daily, key):
+    # Returns the filtered frame and the chosen chains (empty for all).
+    options = sorted(daily["SOURCE_CHAIN"].dropna().unique())
+    chains = st.multiselect("Source Chains", options, key=key, placeholder="All source chains")
+    return (daily[daily["SOURCE_CHAIN"].isin(chains)] if chains else daily), chains
+
+
+# --- Loading State ------------------------------------------------------------------------------------------------------------------------------
+# Every section gets a slot in page order right away; slots whose data is still loading show a
+# placeholder KPI row until their query returns, and are then filled in completion order.
+SECTION_KPIS = {
+    "core": ("Transactions and Users", ("Number of Transactions", "Number of Users", "Avg Txn per User")),
+    "squid": ("Squid Router", ("Volume of Transfers", "Number of Transfers", "Number of Users")),
+    "satellite": ("Satellite Bridge", ("Volume of Transfers", "Number of Transfers", "Number of Users")),
+}
+
+
+def show_loading(slot, name):
+    # A single element, so filling the slot later replaces it completely.
+    label, kpis = SECTION_KPIS[name]
+    cards = "".join(
+        f'<div style="flex: 1;"><div style="font-size: 14px;">{kpi}</div><div style="font-size: 36px; opacity: 0.4;">…</div></div>'
+        for kpi in kpis
+    )
+    slot.markdown(
+        f"""
+        <div style="opacity: 0.8;">⏳ Loading {label} data…</div>
+        <div style="display: flex; gap: 15px; margin-top: 10px;">{cards}</div>
+        """,
+        unsafe_allow_html=True
+    )
@@ -0,0 +1,52 @@
+"""Transactions and Users: KPIs, status over time, users and the status pie."""
+import streamlit as st
+
+from axelar_dashboard import core, figures
+from axelar_dashboard.charts import cached_figure
+from axelar_dashboard.profiling import span, start_fragment_profile
+from axelar_dashboard.sections import drilldown, section_timeframe
+
+
+@st.fragment
+def render(queries, timeframe, start_date, end_date):
+    start_fragment_profile()
+    # Daily rows with mergeable user sketches; every core view and timeframe is rolled up from them locally.
+    core_df = queries.get("core")
+    if core_df is None:
+        return
+    section_tf = section_timeframe("core_timeframe", timeframe)
+
+    # --- Row 1 -----------------------------------------------------------------------------------------------------------------------------------------------------
+    # --- KPI Row -------------------------------
+    with span("KPI row", "chart", section="core"):
+        kpi_df = core.kpi_data(core_df)
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Number of Transactions", f"{kpi_df['Number of Txns'][0]:,} Txns")
+        col2.metric("Number of Users", f"{kpi_df['Number of Users'][0]:,} Wallets")
+        col3.metric("Avg Txn per User", f"{kpi_df['Avg Txn per User'][0]:,} Txns")
+
+    # --- Row 2 -----------------------------------------------------------------------------------------------------------------------------------------------------
+    # --- Transactions Over Time -----------------------------------
+    with span("Transactions over time", "chart", section="core"):
+        txn_df = core.txn_status_data(core_df, section_tf)
+        col1, col2 = st.columns(2)
+        status_bars = cached_figure("core_txn_status", txn_df, figures.txn_status_bars)
+        selected = col1.plotly_chart(
+            status_bars, use_container_width=True, on_select="rerun", selection_mode="points", key="core_txn_status_chart"
+        )
+        col2.plotly_chart(cached_figure("core_txn_status_share", txn_df, figures.txn_status_share_bars), use_container_width=True)
+
+    # --- Drill-Down: the transactions of the clicked date bucket and status ---
+    drilldown.render(
+        drilldown.bucket_selection(selected, status_bars, "core", section_tf, start_date, end_date, trace_filter="status"),
+        "core_drilldown",
+    )
+
+    # --- Row 3 -------------------------------------------------------------------------------------------------------------------------------------------------
+    # --- Users & Avg Txn ----------------------------------------
+    with span("Users & status pie", "chart", section="core"):
+        col1, col2 = st.columns(2)
+        users_df = core.users_data(core_df, section_tf)
+        col1.plotly_chart(cached_figure("core_users", users_df, figures.users_figure), use_container_width=True)
+        status_pie_df = core.status_pie_data(core_df)
+        col2.plotly_chart(cached_figure("core_status_pie", status_pie_df, figures.status_pie), use_container_width=True)
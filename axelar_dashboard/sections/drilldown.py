@@ -0,0 +1,67 @@
+"""Drill-down table under a chart: the raw rows behind the selected bar or bubble, a keyset page at a time.
+
+Charts opt in with ``st.plotly_chart(..., on_select="rerun", selection_mode="points", key=...)``;
+the helpers below turn the selected point into a drilldown.Selection.  Not a page section itself.
+"""
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from axelar_dashboard.drilldown import SessionPages, Selection, bucket_range
+
+
+def _point(event):
+    points = event.selection.points if event is not None else []
+    return points[0] if points else None
+
+
+def bucket_selection(event, figure, source, timeframe, start_date, end_date, trace_filter=None):
+    """Selection for the bar clicked in a time-bucketed chart; ``trace_filter`` pins a column to the bar's trace name."""
+    point = _point(event)
+    if point is None:
+        return None
+    first, last = bucket_range(point["x"], timeframe, start_date, end_date)
+    name = figure.data[point["curve_number"]].name if trace_filter else None
+    return Selection(source, first, last, ((trace_filter, name),) if name else ())
+
+
+def pair_selection(event, source, start_date, end_date):
+    """Selection for the bubble clicked in a source → destination chart."""
+    point = _point(event)
+    if point is None:
+        return None
+    return Selection(source, start_date, end_date, (("destination_chain", point["y"]), ("source_chain", point["x"])))
+
+
+def _pages():
+    state = st.session_state
+    if "drilldown_pages" not in state:
+        ctx = get_script_run_ctx()
+        state["drilldown_pages"] = SessionPages(session=ctx.session_id if ctx is not None else None)
+    return state["drilldown_pages"]
+
+
+def render(selection, key):
+    """Page through ``selection``'s rows; ``key`` names this drill-down's widgets and page position."""
+    if selection is None:
+        st.caption("🔎 Click a bar or bubble above to list its transactions.")
+        return
+    state = st.session_state
+    # Cursors of the pages shown so far, so Previous can step back; a new selection starts over.
+    if state.get(f"{key}_selection") != selection:
+        state[f"{key}_selection"] = selection
+        state[f"{key}_cursors"] = [None]
+    cursors = state[f"{key}_cursors"]
+    pages = _pages()
+    try:
+        with st.spinner("Loading transactions…"):
+            rows, next_after = pages.page(selection, cursors[-1]).result()
+    except Exception as exc:
+        st.error(f"⚠️ Could not load these transactions: {exc}")
+        return
+    pages.prefetch(selection, next_after)
+
+    st.markdown(f"**Transactions** · {selection.describe()} · page {len(cursors)}")
+    st.dataframe(rows, hide_index=True, use_container_width=True)
+    col1, col2 = st.columns(2)
+    col1.button("← Previous", key=f"{key}_previous", disabled=len(cursors) == 1, on_click=cursors.pop)
+    col2.button("Next →", key=f"{key}_next", disabled=next_after is None, on_click=cursors.append, args=(next_after,))
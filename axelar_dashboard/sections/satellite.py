@@ -0,0 +1,60 @@
+"""Satellite Bridge: KPIs, transfers over time and source → destination bubbles, in a lazy expander."""
+import streamlit as st
+
+from axelar_dashboard.executor import PRIORITY_LOW
+from axelar_dashboard.profiling import span, start_fragment_profile
+from axelar_dashboard.sections import section_timeframe, source_chain_filter
+
+
+@st.fragment
+def render(queries, timeframe, start_date, end_date):
+    start_fragment_profile()
+    section = st.expander("Satellite Bridge charts", key="satellite_open", on_change="rerun")
+    if not section.open:
+        return
+    # Collapsed, the section is just its expander; the data and figure modules (pandas, Plotly) load when it opens.
+    from axelar_dashboard import figures, satellite
+    from axelar_dashboard.charts import cached_figure
+
+    with section:
+        # One Satellite join per date range; the KPI row, the time series and the bubbles are all derived from it.
+        queries.ensure("satellite", satellite.load_satellite_daily, start_date, end_date, priority=PRIORITY_LOW)
+        sat_df = queries.get("satellite")
+        if sat_df is None:
+            return
+        col1, col2 = st.columns(2)
+        with col1:
+            section_tf = section_timeframe("satellite_timeframe", timeframe)
+        with col2:
+            sat_df, chains = source_chain_filter(sat_df, "satellite_chains")
+        # Past STREAM_AFTER_DAYS the range is folded and distinct senders become HLL estimates.
+        estimated = satellite.users_estimated(sat_df)
+
+        with span("KPI row", "chart", section="satellite"):
+            sat_kpi_df = satellite.satellite_kpi(sat_df)
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Volume of Transfers", f"${sat_kpi_df['Volume (USD)'][0]:,}")
+            col2.metric("Number of Transfers", f"{sat_kpi_df['Transactions'][0]:,} Txns")
+            col3.metric(
+                "Number of Users", f"{'≈' if estimated else ''}{sat_kpi_df['Users'][0]:,} Addresses",
+                help=f"Estimated for ranges longer than {satellite.STREAM_AFTER_DAYS} days (about ±2%)." if estimated else None,
+            )
+
+        # --- Row 8: Satellite Bridge Over Time --------------------------------------------------------------------------------------------
+        with span("Transfers over time", "chart", section="satellite"):
+            sat_time_df = satellite.satellite_over_time(sat_df, section_tf)
+            col1, col2, col3 = st.columns(3)
+            for col, (y, title, label) in zip((col1, col2, col3), (
+                ("Volume (USD)", "Satellite Bridge Volume Over Time (USD)", "USD"),
+                ("Transactions", "Satellite Bridge Transactions Over Time", "Txns"),
+                ("Users", "Satellite Bridge Users Over Time" + (" (estimated)" if estimated else ""), "Addresses"),
+            )):
+                labels = ((y, label), ("Date", " "))
+                col.plotly_chart(cached_figure("satellite_over_time", sat_time_df, figures.time_series_bars, "Date", y, title, labels), use_container_width=True)
+
+        # --- Row 9: Satellite Bridge Source → Destination ----------------------------------------------------------------------------------
+        with span("Source → destination bubbles", "chart", section="satellite"):
+            sat_src_dest_df = satellite.satellite_src_dest(sat_df, start_date, end_date, chains)
+            col1, col2 = st.columns(2)
+            col1.plotly_chart(cached_figure("satellite_bubbles", sat_src_dest_df, figures.source_dest_bubbles, "Volume (USD)"), use_container_width=True)
+            col2.plotly_chart(cached_figure("satellite_bubbles", sat_src_dest_df, figures.source_dest_bubbles, "Number of Transactions"), use_container_width=True)
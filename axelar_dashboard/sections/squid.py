@@ -0,0 +1,86 @@
+"""Squid Router: KPIs, transfers over time and source → destination bubbles, in a lazy expander."""
+import streamlit as st
+
+from axelar_dashboard.executor import PRIORITY_NORMAL
+from axelar_dashboard.profiling import span, start_fragment_profile
+from axelar_dashboard.sections import section_timeframe, source_chain_filter
+
+
+@st.fragment
+def render(queries, timeframe, start_date, end_date):
+    start_fragment_profile()
+    section = st.expander("Squid Router charts", key="squid_open", on_change="rerun")
+    if not section.open:
+        return
+    # Collapsed, the section is just its expander; the data and figure modules (pandas, Plotly) load when it opens.
+    from axelar_dashboard import figures, squid
+    from axelar_dashboard.charts import cached_figure
+    from axelar_dashboard.sections import drilldown
+
+    with section:
+        # --- Row 4 -------------------------------------------------------------------------------------------------------------------------------------------------------
+        # --- Load Data ----------------------------------------------------------------------------------------------------
+        # One Squid fetch per date range; the KPI row, the time series and the bubbles are all derived from it.
+        queries.ensure("squid", squid.load_squid_daily, start_date, end_date, priority=PRIORITY_NORMAL)
+        squid_df = queries.get("squid")
+        if squid_df is None:
+            return
+        col1, col2 = st.columns(2)
+        with col1:
+            section_tf = section_timeframe("squid_timeframe", timeframe)
+        with col2:
+            squid_df, chains = source_chain_filter(squid_df, "squid_chains")
+
+        # --- KPI Row ------------------------------------------------------------------------------------------------------
+        with span("KPI row", "chart", section="squid"):
+            df_kpi = squid.squid_kpi(squid_df)
+            col1, col2, col3 = st.columns(3)
+
+            col1.metric(
+                label="Volume of Transfers",
+                value=f"${df_kpi['VOLUME_OF_TRANSFERS'][0]:,}"
+            )
+
+            col2.metric(
+                label="Number of Transfers",
+                value=f"{df_kpi['NUMBER_OF_TRANSFERS'][0]:,} Txns"
+            )
+
+            col3.metric(
+                label="Number of Users",
+                value=f"{df_kpi['NUMBER_OF_USERS'][0]:,} Addresses"
+            )
+
+        # --- Row 5 ----------------------------------------------------------------------------------------------------------------------------------------------------------------
+        # --- Charts in One Row ---------------------------------------------------------------------------------------------
+        with span("Transfers over time", "chart", section="squid"):
+            df_ts = squid.squid_time_series(squid_df, section_tf)
+            col1, col2, col3 = st.columns(3)
+
+            for col, (y, title, label, axis) in zip((col1, col2, col3), (
+                ("VOLUME_OF_TRANSFERS", "Squid Bridge Volume Over Time (USD)", "Volume (USD)", "USD"),
+                ("NUMBER_OF_TRANSFERS", "Squid Bridge Transactions Over Time", "Transactions", "Txns"),
+                ("NUMBER_OF_USERS", "Squid Bridge Users Over Time", "Users", "Addresses"),
+            )):
+                labels = ((y, label), ("DATE", "Date"))
+                col.plotly_chart(
+                    cached_figure("squid_over_time", df_ts, figures.time_series_bars, "DATE", y, title, labels, axis, "#535dfa"),
+                    use_container_width=True
+                )
+
+        # --- Row 6: Source-Destination Overview ------------------------------------------------------------------------------------------------
+        with span("Source → destination bubbles", "chart", section="squid"):
+            src_dest_df = squid.squid_source_dest(squid_df, start_date, end_date, chains)
+            # Bubble Chart 1: Volume, Bubble Chart 2: Number of Transactions
+            col1, col2 = st.columns(2)
+            selected = [
+                col.plotly_chart(
+                    cached_figure("squid_bubbles", src_dest_df, figures.source_dest_bubbles, size),
+                    use_container_width=True, on_select="rerun", selection_mode="points", key=f"squid_bubbles_{i}",
+                )
+                for i, (col, size) in enumerate(((col1, "Volume (USD)"), (col2, "Number of Transactions")))
+            ]
+
+        # --- Drill-Down: the transfers of the clicked chain pair ---
+        selections = [drilldown.pair_selection(event, "squid", start_date, end_date) for event in selected]
+        drilldown.render(next((selection for selection in selections if selection), None), "squid_drilldown")
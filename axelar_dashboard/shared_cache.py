@@ -0,0 +1,196 @@
+"""Second-tier result cache shared by every dashboard replica.
+
+The range cache (cache.py) lives in one process; this one lives in a store all
+replicas can reach, so a warehouse result computed by any replica is reused by
+the others.  Configure it with ``[shared_cache] url`` in the Streamlit secrets
+or the ``AXELAR_DASHBOARD_SHARED_CACHE`` environment variable:
+
+* a directory path (or ``file:///path``), e.g. a volume mounted on every replica;
+* ``redis://host:6379/0`` (or ``rediss://``), which needs the ``redis`` package;
+* ``memory://``, a process-local stand-in with the same interface.
+
+Entries are Arrow IPC streams, zstd-compressed, keyed by the normalized query
+text and its parameters.  Results that reach days which are not settled yet
+(see store.py), the open UTC day included, expire after ``open_ttl`` seconds,
+others after ``closed_ttl``.
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import struct
+import threading
+import time
+from datetime import date
+
+import pyarrow as pa
+import streamlit as st
+
+from axelar_dashboard.store import settled_before
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cached representation changes, so replicas on different versions never share entries.
+KEY_VERSION = 1
+
+
+# --- Stores: the get / set(ex=) subset of the Redis API --------------------------------------------------------------------------
+class MemoryStore:
+    """Process-local stand-in for a Redis server, for tests and single-replica runs."""
+
+    def __init__(self):
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value, expires_at = self._values.get(key, (None, None))
+            if expires_at is not None and expires_at <= time.time():
+                del self._values[key]
+                return None
+            return value
+
+    def set(self, key, value, ex=None):
+        with self._lock:
+            self._values[key] = (value, None if ex is None else time.time() + ex)
+
+
+class DirectoryStore:
+    """One file per key in a directory shared by the replicas; the expiry time is an 8-byte header."""
+
+    _HEADER = struct.Struct("<d")
+
+    def __init__(self, root, prune_every=256):
+        self.root = root
+        self.prune_every = prune_every
+        self._writes = 0
+        os.makedirs(root, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.root, f"{key}.arrows")
+
+    def get(self, key):
+        try:
+            with open(self._path(key), "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        (expires_at,) = self._HEADER.unpack_from(data)
+        if expires_at <= time.time():
+            return None
+        return data[self._HEADER.size:]
+
+    def set(self, key, value, ex=None):
+        expires_at = float("inf") if ex is None else time.time() + ex
+        path = self._path(key)
+        # Write then rename, so a replica reading concurrently sees the old file or the new one, never half of one.
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(self._HEADER.pack(expires_at))
+            f.write(value)
+        os.replace(tmp, path)
+        self._writes += 1
+        if self._writes % self.prune_every == 0:
+            self.prune()
+
+    def prune(self):
+        """Delete expired entries."""
+        now = time.time()
+        for name in os.listdir(self.root):
+            if not name.endswith(".arrows"):
+                continue
+            path = os.path.join(self.root, name)
+            try:
+                with open(path, "rb") as f:
+                    (expires_at,) = self._HEADER.unpack(f.read(self._HEADER.size))
+                if expires_at <= now:
+                    os.remove(path)
+            except (OSError, struct.error):
+                continue
+
+
+def redis_store(url):
+    try:
+        import redis
+    except ImportError as exc:
+        raise RuntimeError(f"shared cache {url!r} needs the redis package (pip install redis)") from exc
+    return redis.Redis.from_url(url)
+
+
+# --- Keys ------------------------------------------------------------------------------------------------------------------------
+_TOKENS = re.compile(r"'(?:[^']|'')*'|\s+")
+
+
+def normalize_query(query):
+    """Collapse whitespace outside string literals, so formatting differences share one entry."""
+    return _TOKENS.sub(lambda m: m.group(0) if m.group(0).startswith("'") else " ", query).strip()
+
+
+def touches_unsettled_days(params):
+    # Range parameters carry an exclusive ISO ``end``; without one, assume the result can still change.
+    end = (params or {}).get("end")
+    return end is None or date.fromisoformat(str(end)[:10]) > settled_before()
+
+
+# --- Cache -----------------------------------------------------------------------------------------------------------------------
+class SharedResultCache:
+    """Arrow results in a shared key/value store, keyed by normalized query text and parameters."""
+
+    def __init__(self, store, open_ttl=900, closed_ttl=7 * 24 * 3600, compression="zstd", prefix="axelar-dashboard"):
+        self.store = store
+        self.open_ttl = open_ttl
+        self.closed_ttl = closed_ttl
+        self.compression = compression
+        self.prefix = prefix
+
+    def key(self, query, params=None):
+        payload = json.dumps([KEY_VERSION, normalize_query(query), params or {}], sort_keys=True, default=str)
+        return f"{self.prefix}-{hashlib.blake2b(payload.encode('utf-8'), digest_size=20).hexdigest()}"
+
+    def get(self, query, params=None):
+        """The cached table, or None on a miss or if the store cannot be reached."""
+        try:
+            data = self.store.get(self.key(query, params))
+            if data is None:
+                return None
+            return pa.ipc.open_stream(pa.py_buffer(data)).read_all()
+        except Exception:
+            logger.warning("Shared cache read failed; querying the warehouse", exc_info=True)
+            return None
+
+    def put(self, query, params, table):
+        sink = pa.BufferOutputStream()
+        options = pa.ipc.IpcWriteOptions(compression=self.compression)
+        with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+            writer.write_table(table)
+        ttl = self.open_ttl if touches_unsettled_days(params) else self.closed_ttl
+        try:
+            self.store.set(self.key(query, params), sink.getvalue().to_pybytes(), ex=ttl)
+        except Exception:
+            logger.warning("Shared cache write failed", exc_info=True)
+
+
+def from_url(url):
+    if url.startswith(("redis://", "rediss://")):
+        return SharedResultCache(redis_store(url))
+    if url == "memory://":
+        return SharedResultCache(MemoryStore())
+    return SharedResultCache(DirectoryStore(url.removeprefix("file://")))
+
+
+_shared = None
+_shared_lock = threading.Lock()
+_configured = False
+
+
+def get_shared_cache():
+    """The configured SharedResultCache, or None when no url is set."""
+    global _shared, _configured
+    if not _configured:
+        with _shared_lock:
+            if not _configured:
+                url = os.environ.get("AXELAR_DASHBOARD_SHARED_CACHE") or st.secrets.get("shared_cache", {}).get("url")
+                _shared = from_url(url) if url else None
+                _configured = True
+    return _shared
@@ -0,0 +1,113 @@
+import hashlib
+import json
+import math
+
+import numpy as np
+import pandas as pd
+
+
+def _hash(value):
+    return int.from_bytes(hashlib.blake2b(str(value).encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class HllSketch:
+    """HyperLogLog registers compatible with Snowflake's ``HLL_EXPORT`` state.
+
+    Daily rows carry one exported state per distinct-count column; merging the
+    registers (element-wise max) gives the distinct count of any union of days
+    without going back to the warehouse.
+    """
+
+    def __init__(self, precision=12, registers=None):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8) if registers is None else registers
+
+    @classmethod
+    def from_export(cls, state):
+        if isinstance(state, str):
+            state = json.loads(state)
+        sketch = cls(state.get("precision", 12))
+        if "dense" in state:
+            sketch.registers[:] = state["dense"]
+        elif "sparse" in state:
+            sparse = state["sparse"]
+            sketch.registers[np.asarray(sparse["indices"], dtype=np.int64)] = sparse["maxLzCounts"]
+        return sketch
+
+    def to_export(self):
+        indices = np.flatnonzero(self.registers)
+        if len(indices) * 2 < len(self.registers):
+            body = {"sparse": {"indices": indices.tolist(), "maxLzCounts": self.registers[indices].tolist()}}
+        else:
+            body = {"dense": self.registers.tolist()}
+        return json.dumps({"version": 4, "precision": self.precision, **body}, separators=(",", ":"))
+
+    def add(self, value):
+        # Local counterpart of HLL_ACCUMULATE; its states only merge with other locally built states.
+        h = _hash(value)
+        index = h >> (64 - self.precision)
+        rest = h & ((1 << (64 - self.precision)) - 1)
+        rank = (64 - self.precision) - rest.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def merge(self, other):
+        if other.precision != self.precision:
+            raise ValueError(f"Cannot merge HLL precision {other.precision} into {self.precision}")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def estimate(self):
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+
+def merge_states(states):
+    merged = None
+    for state in states:
+        if state is None or (isinstance(state, float) and math.isnan(state)):
+            continue
+        sketch = HllSketch.from_export(state)
+        merged = sketch if merged is None else merged.merge(sketch)
+    return merged
+
+
+def distinct_count(states):
+    merged = merge_states(states)
+    return 0 if merged is None else merged.estimate()
+
+
+def _bit_length(values):
+    # Vectorized int.bit_length for uint64.
+    values = values.copy()
+    length = np.zeros(len(values), dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        wide = values >= np.uint64(1 << shift)
+        length += shift * wide
+        values[wide] >>= np.uint64(shift)
+    return length + (values > 0)
+
+
+def build_states(groups, values, n_groups, precision=12):
+    """One ``HLL_EXPORT`` state per group code in ``range(n_groups)`` over the ``values`` in that group.
+
+    The same states ``HllSketch.add`` would build value by value (so they merge with
+    them), but each distinct value is hashed once and registers are filled in bulk.
+    Missing values are skipped.
+    """
+    codes, uniques = pd.factorize(pd.Series(values), use_na_sentinel=True)
+    hashes = np.fromiter((_hash(value) for value in uniques), dtype=np.uint64, count=len(uniques))
+    present = codes >= 0
+    h = hashes[codes[present]]
+    groups = np.asarray(groups)[present]
+    bits = 64 - precision
+    index = (h >> np.uint64(bits)).astype(np.int64)
+    rank = (bits - _bit_length(h & np.uint64((1 << bits) - 1)) + 1).astype(np.uint8)
+    registers = np.zeros((n_groups, 1 << precision), dtype=np.uint8)
+    np.maximum.at(registers, (groups, index), rank)
+    return [HllSketch(precision, row).to_export() for row in registers]
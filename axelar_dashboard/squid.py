@@ -0,0 +1,53 @@
+import pandas as pd
+
+from axelar_dashboard.aggregate import round_sum, truncate
+from axelar_dashboard.cache import range_cache
+from axelar_dashboard.cube import get_cube, pair_totals
+from axelar_dashboard.daily import load_daily
+from axelar_dashboard.queries import SQUID_DAILY
+from axelar_dashboard.sketch import distinct_count
+
+
+# --- Squid Facts: one scan per date range ----------------------------------------------------------------------------------
+# Every Squid view (KPIs, time series, chain-pair bubbles) is derived from this frame, one row per
+# (day, source chain, destination chain). Distinct users travel as an HLL_EXPORT state so they can be
+# merged across days and pairs without another query.
+def _cube():
+    return get_cube("squid", ("VOLUME_USD", "N_PRICED_TRANSFERS"), priced="N_PRICED_TRANSFERS")
+
+
+@range_cache
+def load_squid_daily(start_date, end_date):
+    daily = load_daily(SQUID_DAILY, start_date, end_date)
+    _cube().add(daily, start_date, end_date)
+    return daily
+
+
+# --- Derived Views -----------------------------------------------------------------------------------------------------------
+def squid_kpi(daily):
+    return pd.DataFrame({
+        "NUMBER_OF_TRANSFERS": [int(daily["N_TRANSFERS"].sum())],
+        "NUMBER_OF_USERS": [distinct_count(daily["USERS_HLL"])],
+        "VOLUME_OF_TRANSFERS": [round_sum(daily["VOLUME_USD"])],
+    })
+
+
+def squid_time_series(daily, timeframe):
+    grouped = daily.groupby(truncate(daily["DAY"], timeframe).rename("DATE"))
+    return pd.DataFrame({
+        "NUMBER_OF_TRANSFERS": grouped["N_TRANSFERS"].sum(),
+        "NUMBER_OF_USERS": grouped["USERS_HLL"].agg(distinct_count),
+        "VOLUME_OF_TRANSFERS": grouped["VOLUME_USD"].agg(round_sum),
+    }).reset_index().sort_values("DATE")
+
+
+def squid_source_dest(daily, start_date, end_date, sources=()):
+    # ``daily`` is the range's frame after the section's source-chain filter, whose choice is ``sources``.
+    totals = pair_totals(_cube(), daily, start_date, end_date, sources)
+    df = pd.DataFrame({
+        "Source Chain": totals["SOURCE_CHAIN"],
+        "Destination Chain": totals["DESTINATION_CHAIN"],
+        "Volume (USD)": totals["VOLUME_USD"].round(),
+        "Number of Transactions": totals["N_PRICED_TRANSFERS"],
+    })
+    return df.sort_values(["Volume (USD)", "Number of Transactions"], ascending=[False, True], ignore_index=True)
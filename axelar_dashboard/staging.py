@@ -0,0 +1,245 @@
+"""Optional pre-flattened staging tables for the Squid and Satellite facts.
+
+Provision or refresh them with::
+
+    python -m axelar_dashboard.staging --since 2024-01-01
+
+The schema comes from ``[staging] schema`` in the Streamlit secrets.  Loaders read
+from the staging tables only when they exist and hold every day of the requested
+range (``STAGING_STATE`` records the staged span of each table); otherwise they
+fall back to the raw fact_transfers/fact_gmp SQL.  All statements are plain
+DDL/DML with literal timestamps; the flattening SELECTs are Snowflake SQL (VARIANT
+paths), so locally they run through ``localdb.DuckDBConnection``, which rewrites
+them for DuckDB, by passing its cursor's ``execute``.
+"""
+import argparse
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+import streamlit as st
+
+from axelar_dashboard.connection import get_pool, read_frame
+from axelar_dashboard.queries import SATELLITE_TRANSFERS, SQUID_FACTS, satellite_facts, time_range
+
+logger = logging.getLogger(__name__)
+
+STATE_TABLE = "STAGING_STATE"
+
+
+@dataclass(frozen=True)
+class StagingTable:
+    name: str
+    columns: tuple  # (column, type) pairs
+    source: str  # SELECT over the raw tables producing ``columns``, with %(start)s/%(end)s on created_at
+    time_column: str = "created_at"
+
+
+SQUID_TRANSFERS = StagingTable(
+    name="SQUID_TRANSFERS",
+    columns=(
+        ("created_at", "TIMESTAMP"),
+        ("source_chain", "VARCHAR"),
+        ("destination_chain", "VARCHAR"),
+        ("user_address", "VARCHAR"),
+        ("amount_usd", "DOUBLE"),
+        ("fee", "DOUBLE"),
+        ("service", "VARCHAR"),
+        ("id", "VARCHAR"),
+        ("tx_hash", "VARCHAR"),
+    ),
+    source=f"""
+        SELECT ts AS created_at, source_chain, destination_chain, user AS user_address,
+               amount_usd, fee, service, id, tx_hash
+        FROM ({SQUID_FACTS})
+    """,
+)
+
+SATELLITE_TRANSFERS_TABLE = StagingTable(
+    name="SATELLITE_TRANSFERS",
+    columns=(
+        ("created_at", "TIMESTAMP"),
+        ("tx_hash", "VARCHAR"),
+        ("amount_usd", "DOUBLE"),
+    ),
+    source=SATELLITE_TRANSFERS,
+)
+
+TABLES = (SQUID_TRANSFERS, SATELLITE_TRANSFERS_TABLE)
+
+
+# --- Statement Generation --------------------------------------------------------------------------------------------------------
+def _literal(moment):
+    return f"'{moment:%Y-%m-%d %H:%M:%S}'"
+
+
+def render(sql, start, end):
+    """Inline the range as literal timestamps so the statement runs on any engine."""
+    return sql % {"start": _literal(start), "end": _literal(end)}
+
+
+def create_statements(schema, tables=TABLES):
+    statements = [
+        f"CREATE TABLE IF NOT EXISTS {schema}.{STATE_TABLE} (table_name VARCHAR, refreshed_from TIMESTAMP, refreshed_through TIMESTAMP)",
+    ]
+    for table in tables:
+        columns = ", ".join(f"{name} {type_}" for name, type_ in table.columns)
+        statements.append(f"CREATE TABLE IF NOT EXISTS {schema}.{table.name} ({columns})")
+    return statements
+
+
+def refresh_statements(table, schema, since, until, staged_from=None):
+    """Replace every staged row in [since, until) with freshly flattened rows, and move the watermark.
+
+    ``staged_from`` is the start of the staged span, when rows before ``since`` are kept.
+    """
+    target = f"{schema}.{table.name}"
+    columns = ", ".join(name for name, _ in table.columns)
+    return [
+        "BEGIN",
+        f"DELETE FROM {target} WHERE {table.time_column} >= {_literal(since)}",
+        f"INSERT INTO {target} ({columns}) {render(table.source, since, until)}",
+        f"DELETE FROM {schema}.{STATE_TABLE} WHERE table_name = '{table.name}'",
+        f"INSERT INTO {schema}.{STATE_TABLE} (table_name, refreshed_from, refreshed_through) "
+        f"VALUES ('{table.name}', {_literal(staged_from or since)}, {_literal(until)})",
+        "COMMIT",
+    ]
+
+
+def provision(execute, query_state, schema, since, overlap=timedelta(days=2), until=None, tables=TABLES):
+    """Create missing tables and refresh each one incrementally.
+
+    ``execute(statement)`` runs one statement; ``query_state(sql)`` returns
+    (table_name, refreshed_from, refreshed_through) rows.  Tables that were
+    refreshed before are re-flattened from ``overlap`` before their watermark, so
+    late status changes are picked up; new tables, tables whose staged span is
+    unknown and tables asked to start earlier than they do are filled from ``since``.
+    """
+    until = until or datetime.now(timezone.utc).replace(tzinfo=None, second=0, microsecond=0)
+    for statement in create_statements(schema, tables):
+        execute(statement)
+    state = {
+        name: (staged_from, watermark)
+        for name, staged_from, watermark in query_state(
+            f"SELECT table_name, refreshed_from, refreshed_through FROM {schema}.{STATE_TABLE}"
+        )
+    }
+    for table in tables:
+        staged_from, watermark = (_as_datetime(value) for value in state.get(table.name, (None, None)))
+        if watermark is None or staged_from is None or since < staged_from:
+            start, staged_from = since, None
+        else:
+            start = max(since, watermark - overlap)
+        logger.info("Refreshing %s.%s from %s to %s", schema, table.name, start, until)
+        for statement in refresh_statements(table, schema, start, until, staged_from):
+            execute(statement)
+
+
+def _as_datetime(value):
+    # Snowflake hands back datetimes, pandas Timestamps; engines without a timestamp type hand back text.
+    if value is None or value != value:
+        return None
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return value.to_pydatetime() if hasattr(value, "to_pydatetime") else value
+
+
+# --- Loader Integration ----------------------------------------------------------------------------------------------------------
+def _staged_squid(schema):
+    return f"""
+    SELECT created_at AS ts, source_chain, destination_chain, user_address AS user,
+           amount_usd, fee, id, tx_hash, service
+    FROM {schema}.{SQUID_TRANSFERS.name}
+    WHERE {time_range("created_at")}
+"""
+
+
+def _staged_satellite(schema):
+    return satellite_facts(f"""
+        SELECT tx_hash, amount_usd
+        FROM {schema}.{SATELLITE_TRANSFERS_TABLE.name}
+        WHERE {time_range("created_at")}
+    """)
+
+
+STAGED_FACTS = {
+    "squid": (SQUID_TRANSFERS, _staged_squid),
+    "satellite": (SATELLITE_TRANSFERS_TABLE, _staged_satellite),
+}
+
+_STATE_TTL = 300
+_state = {"loaded_at": None, "spans": {}}
+_state_lock = threading.Lock()
+
+
+def _schema():
+    return st.secrets.get("staging", {}).get("schema")
+
+
+def _spans(schema):
+    """table name -> (refreshed_from, refreshed_through) of every staging table, re-read every ``_STATE_TTL`` seconds."""
+    with _state_lock:
+        if _state["loaded_at"] is not None and time.monotonic() - _state["loaded_at"] <= _STATE_TTL:
+            return _state["spans"]
+    # Read outside the lock so a slow warehouse does not hold up callers that only need the cached spans.
+    try:
+        df = read_frame(
+            "SELECT table_name AS TABLE_NAME, refreshed_from AS REFRESHED_FROM, refreshed_through AS REFRESHED_THROUGH "
+            f"FROM {schema}.{STATE_TABLE}"
+        )
+        spans = {
+            name: (_as_datetime(staged_from), _as_datetime(watermark))
+            for name, staged_from, watermark in zip(df["TABLE_NAME"], df["REFRESHED_FROM"], df["REFRESHED_THROUGH"])
+        }
+    except Exception:
+        # Not provisioned (or not readable): use the raw tables.
+        spans = {}
+    with _state_lock:
+        _state["spans"], _state["loaded_at"] = spans, time.monotonic()
+    return spans
+
+
+def facts_for(spec, start_date, end_date):
+    """The staged fact CTE for ``spec`` if its staging table holds all of [start_date, end_date], else None (use the raw CTE)."""
+    staged = STAGED_FACTS.get(spec.name)
+    schema = _schema()
+    if staged is None or not schema:
+        return None
+    table, build = staged
+    staged_from, watermark = _spans(schema).get(table.name, (None, None))
+    if staged_from is None or staged_from > datetime.combine(start_date, datetime.min.time()):
+        return None
+    if watermark is None or watermark < datetime.combine(end_date + timedelta(days=1), datetime.min.time()):
+        return None
+    return build(schema)
+
+
+# --- Command Line ---------------------------------------------------------------------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Create and incrementally refresh the dashboard staging tables.")
+    parser.add_argument("--schema", default=None, help="Target DATABASE.SCHEMA (default: [staging] schema in secrets)")
+    parser.add_argument("--since", default="2023-01-01", help="First day to stage when a table is new")
+    parser.add_argument("--overlap-days", type=int, default=2, help="Days before the watermark to re-flatten")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    schema = args.schema or _schema()
+    if not schema:
+        parser.error("no schema given and [staging] schema is not set in secrets")
+
+    # One connection for the whole run, so BEGIN/COMMIT bracket each table's refresh.
+    with get_pool().connection() as conn:
+        cur = conn.cursor()
+        provision(
+            cur.execute,
+            lambda sql: cur.execute(sql).fetchall(),
+            schema,
+            datetime.fromisoformat(args.since),
+            timedelta(days=args.overlap_days),
+        )
+
+
+if __name__ == "__main__":
+    main()
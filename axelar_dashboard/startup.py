@@ -0,0 +1,118 @@
+"""Cold-start profile of the page.
+
+    python -m axelar_dashboard.startup                   # import cost of Main_Dashboard.py's top-level imports
+    python -m axelar_dashboard.startup --render          # plus the time to first paint of a rendered page
+    python -m axelar_dashboard.startup --budget-ms 800   # exit 1 if the imports take longer
+
+Runs the page's top-level import statements in a fresh interpreter under
+``-X importtime`` and reports the total and the slowest modules, i.e. what every
+new server process pays before the page can show anything.  ``--render`` also
+runs the page once under ``AppTest`` in a fresh interpreter and reports its
+``imports`` and ``first paint`` profile marks (see profiling.py), failing if the
+page never painted.  The marks start after Streamlit itself is loaded, and
+sections whose data fails to load (no warehouse configured) do not delay them.
+Heavy modules (pandas, Plotly, the Snowflake connector, pyarrow) are meant to
+load after first paint; add ``--budget-ms`` to a CI job to keep it that way.
+"""
+import argparse
+import ast
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+SCRIPT = Path(__file__).resolve().parent.parent / "Main_Dashboard.py"
+
+# Runs in the child interpreter: render the page once and print its startup marks as JSON.
+_RENDER = """
+import json, logging, sys
+from streamlit.testing.v1 import AppTest
+
+marks = {}
+
+class Marks(logging.Handler):
+    def emit(self, record):
+        entry = json.loads(record.getMessage())
+        if entry.get("kind") == "startup":
+            marks[entry["name"]] = entry["wall_ms"]
+
+logger = logging.getLogger("axelar_dashboard.profiling")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+logger.addHandler(Marks())
+AppTest.from_file(sys.argv[1], default_timeout=600).run()
+print(json.dumps(marks))
+"""
+
+
+def page_imports(script=SCRIPT):
+    """The module-level import statements of ``script``, as source lines."""
+    tree = ast.parse(Path(script).read_text())
+    return [ast.unparse(node) for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+
+
+def import_times(statements, cwd=SCRIPT.parent):
+    """Run ``statements`` in a fresh interpreter; returns ``(module, depth, self_us, cumulative_us)`` per module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "\n".join(statements)],
+        cwd=cwd, capture_output=True, text=True, check=True,
+    )
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        own, cumulative, name = line.removeprefix("import time:").split("|")
+        # Nested imports are indented by two spaces per level.
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        modules.append((name.strip(), depth, int(own), int(cumulative)))
+    return modules
+
+
+def render_marks(script=SCRIPT):
+    """The ``imports`` and ``first paint`` marks, in ms, of one render in a fresh interpreter.
+
+    Raises RuntimeError if the page never reached its first paint.
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", _RENDER, str(script)],
+        cwd=Path(script).parent, capture_output=True, text=True, check=True,
+    )
+    marks = json.loads(result.stdout.strip().splitlines()[-1])
+    if "first paint" not in marks:
+        raise RuntimeError(f"{Path(script).name} did not reach its first paint; marks: {marks}\n{result.stderr[-2000:]}")
+    return marks
+
+
+# --- Command Line ---------------------------------------------------------------------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure the page's cold-start import cost and time to first paint.")
+    parser.add_argument("--top", type=int, default=15, help="How many of the slowest modules to list")
+    parser.add_argument("--render", action="store_true", help="Also render the page once and report its first paint")
+    parser.add_argument("--budget-ms", type=float, default=None, help="Exit 1 if the page's imports take longer")
+    args = parser.parse_args(argv)
+
+    statements = page_imports()
+    modules = import_times(statements)
+    total_ms = sum(cumulative for _, depth, _, cumulative in modules if depth == 0) / 1000
+    print(f"{len(modules)} modules imported by {SCRIPT.name} in {total_ms:.0f} ms")
+    print(f"{'module':<64}{'self ms':>10}{'cumulative ms':>16}")
+    for name, _, own, cumulative in sorted(modules, key=lambda module: -module[3])[:args.top]:
+        print(f"{name:<64}{own / 1000:>10.1f}{cumulative / 1000:>16.1f}")
+
+    if args.render:
+        try:
+            marks = render_marks()
+        except RuntimeError as exc:
+            print(exc, file=sys.stderr)
+            return 1
+        for name, wall_ms in marks.items():
+            print(f"{name}: {wall_ms:.0f} ms after the script started")
+
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        print(f"over budget: {total_ms:.0f} ms > {args.budget_ms:.0f} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
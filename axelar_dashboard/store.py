@@ -0,0 +1,135 @@
+import os
+import threading
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+import streamlit as st
+
+# Days younger than this are not written to the day store yet: rows for them can still land late in the warehouse.
+SETTLE_DAYS = 2
+
+
+def utc_today():
+    return datetime.now(timezone.utc).date()
+
+
+def _as_date(value):
+    return value.date() if isinstance(value, datetime) else value
+
+
+def _runs(days):
+    """Group sorted days into contiguous (first, last) runs so each gap costs one query."""
+    runs = []
+    for day in days:
+        if runs and day == runs[-1][1] + timedelta(days=1):
+            runs[-1][1] = day
+        else:
+            runs.append([day, day])
+    return [tuple(run) for run in runs]
+
+
+def day_windows(start_date, end_date, days):
+    """Split [start_date, end_date] into consecutive (first, last) windows of at most ``days`` days."""
+    while start_date <= end_date:
+        last = min(start_date + timedelta(days=days - 1), end_date)
+        yield start_date, last
+        start_date = last + timedelta(days=1)
+
+
+class DailyStore:
+    """On-disk daily aggregates, one Parquet file per (dataset, day).
+
+    Days more than ``settle_days`` before the current UTC day are settled and never
+    change, so once written they are served from disk for any range that covers
+    them.  Newer days, the open day included, are always re-fetched.
+    """
+
+    def __init__(self, root, settle_days=0):
+        self.root = root
+        self.settle_days = settle_days
+
+    def settled_before(self, today=None):
+        """The first day that is not settled yet."""
+        return (today or utc_today()) - timedelta(days=self.settle_days)
+
+    def path(self, dataset, day):
+        return os.path.join(self.root, dataset, f"day={day.isoformat()}.parquet")
+
+    def has(self, dataset, day):
+        return os.path.exists(self.path(dataset, day))
+
+    def missing_days(self, dataset, start_date, end_date):
+        settled_before = self.settled_before()
+        days = pd.date_range(_as_date(start_date), _as_date(end_date), freq="D").date
+        return [day for day in days if day >= settled_before or not self.has(dataset, day)]
+
+    def load_range(self, dataset, start_date, end_date, fetch, day_column="DAY"):
+        """Return rows for [start_date, end_date], calling ``fetch(first, last)`` only for the days not on disk."""
+        start_date, end_date = _as_date(start_date), _as_date(end_date)
+        if start_date > end_date:
+            return fetch(start_date, end_date)
+        missing, fetched = self.fill(dataset, start_date, end_date, fetch, day_column)
+
+        missing = set(missing)
+        cached = [
+            pd.read_parquet(self.path(dataset, day))
+            for day in pd.date_range(start_date, end_date, freq="D").date
+            if day not in missing
+        ]
+        frames = cached + fetched
+        non_empty = [df for df in frames if len(df)]
+        if not non_empty:
+            return frames[0]
+        return pd.concat(non_empty, ignore_index=True).sort_values(day_column, ignore_index=True)
+
+    def iter_range(self, dataset, start_date, end_date, fetch, window_days=31, day_column="DAY"):
+        """``(first, last, rows)`` per window of ``window_days`` days, so a long range is never in memory at once."""
+        for first, last in day_windows(_as_date(start_date), _as_date(end_date), window_days):
+            yield first, last, self.load_range(dataset, first, last, fetch, day_column)
+
+    def fill(self, dataset, start_date, end_date, fetch, day_column="DAY"):
+        """Fetch and write the days of [start_date, end_date] not on disk; return (missing days, fetched frames)."""
+        settled_before = self.settled_before()
+        missing = self.missing_days(dataset, start_date, end_date)
+        fetched = []
+        for first, last in _runs(missing):
+            df = fetch(first, last)
+            self._write_settled_days(dataset, df, first, min(last, settled_before - timedelta(days=1)), day_column)
+            fetched.append(df)
+        return missing, fetched
+
+    def _write_settled_days(self, dataset, df, first, last, day_column):
+        if last < first:
+            return
+        os.makedirs(os.path.join(self.root, dataset), exist_ok=True)
+        by_day = {key.date(): rows for key, rows in df.groupby(pd.to_datetime(df[day_column]).dt.normalize())}
+        # Days without rows are written as empty files too, so they are not re-queried.
+        for day in pd.date_range(first, last, freq="D").date:
+            rows = by_day.get(day, df.iloc[0:0])
+            target = self.path(dataset, day)
+            tmp = f"{target}.{uuid.uuid4().hex}.tmp"
+            rows.to_parquet(tmp, index=False)
+            os.replace(tmp, target)
+
+
+# --- Process-wide store ----------------------------------------------------------------------------------------------------
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                settings = st.secrets.get("store", {})
+                root = os.environ.get("AXELAR_DASHBOARD_STORE") or settings.get("path", ".cache/daily_store")
+                settle_days = os.environ.get("AXELAR_DASHBOARD_SETTLE_DAYS") or settings.get("settle_days", SETTLE_DAYS)
+                _store = DailyStore(root, int(settle_days))
+    return _store
+
+
+def settled_before():
+    """The first day whose aggregates can still change; caches keep only results before it for good."""
+    return get_store().settled_before()
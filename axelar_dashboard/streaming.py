@@ -0,0 +1,144 @@
+"""Fold long ranges into running aggregates one window at a time, within a memory ceiling.
+
+Day-grain results over multi-year ranges can be far larger than the aggregates
+the page shows.  ``StreamingAggregate`` takes the rows a window at a time (see
+``DailyStore.iter_range``) and keeps only per-group sums and HLL states.  When
+those partial aggregates outgrow the ceiling they are spilled to disk as Parquet
+runs, hash-partitioned by group, and merged one partition at a time at the end.
+Configure the ceiling with ``[streaming] memory_mb`` in the Streamlit secrets
+or the ``AXELAR_DASHBOARD_STREAM_MEMORY_MB`` environment variable, and where
+spills go with ``[streaming] spill_dir`` (default: the system temp directory).
+"""
+import glob
+import os
+import shutil
+import tempfile
+
+import pandas as pd
+import streamlit as st
+
+from axelar_dashboard.dtypes import frame_nbytes
+from axelar_dashboard.profiling import annotate
+from axelar_dashboard.sketch import build_states, merge_states
+
+DEFAULT_MEMORY_MB = 256
+
+
+def _settings():
+    return st.secrets.get("streaming", {})
+
+
+def configured_memory_limit():
+    """The configured ceiling on in-memory partial aggregates, in bytes."""
+    mb = os.environ.get("AXELAR_DASHBOARD_STREAM_MEMORY_MB") or _settings().get("memory_mb", DEFAULT_MEMORY_MB)
+    return int(float(mb) * 1024 * 1024)
+
+
+def _merged_state(states):
+    merged = merge_states(states)
+    return None if merged is None else merged.to_export()
+
+
+class StreamingAggregate:
+    """Per-group sums and HLL states of every frame passed to ``add``, merged by ``result``.
+
+    ``sums`` are added up (NULL when every value is NULL, like SQL's SUM); ``sketches``
+    are columns of ``HLL_EXPORT`` states, merged; ``build_sketches`` maps a new state
+    column to a column of raw values (e.g. senders) to build states from.  Use it as a
+    context manager, or call ``close``, to remove spill files.
+    """
+
+    def __init__(self, keys, sums=(), sketches=(), build_sketches=None, memory_limit=None, spill_dir=None, partitions=16):
+        self.keys = list(keys)
+        self.sums = list(sums)
+        self.sketches = list(sketches)
+        self.build_sketches = dict(build_sketches or {})
+        self.memory_limit = memory_limit if memory_limit is not None else configured_memory_limit()
+        self.spill_dir = spill_dir if spill_dir is not None else _settings().get("spill_dir")
+        self.partitions = partitions
+        self._parts = []
+        self._bytes = 0
+        self._tmp = None
+        self.spills = 0
+        self.spilled_bytes = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._tmp is not None:
+            shutil.rmtree(self._tmp, ignore_errors=True)
+            self._tmp = None
+
+    # --- Folding -----------------------------------------------------------------------------------------------------------
+    def _grouped(self, frame):
+        return frame.groupby(self.keys, observed=True, dropna=False, sort=False)
+
+    def _fold(self, frame, states, build):
+        # ``states`` already hold HLL states and are merged; with ``build``, states are also built from raw values.
+        # Counts arrive downcast (see dtypes.py); widen them so sums over many days cannot overflow.
+        frame = frame.astype({column: "int64" for column in self.sums if pd.api.types.is_integer_dtype(frame[column].dtype)})
+        grouped = self._grouped(frame)
+        out = grouped[self.sums].sum(min_count=1)
+        for column in states:
+            out[column] = grouped[column].agg(_merged_state)
+        if build:
+            codes = grouped.ngroup().to_numpy()
+            for column, source in self.build_sketches.items():
+                out[column] = build_states(codes, frame[source], grouped.ngroups)
+        return out.reset_index()
+
+    def add(self, frame):
+        if not len(frame):
+            return
+        part = self._fold(frame, self.sketches, build=True)
+        self._parts.append(part)
+        self._bytes += frame_nbytes(part)
+        if self._bytes > self.memory_limit:
+            self._compact()
+            # Merging in memory was not enough to get well under the ceiling: move everything to disk.
+            if self._bytes > self.memory_limit // 2:
+                self._spill()
+
+    def _state_columns(self):
+        return self.sketches + list(self.build_sketches)
+
+    def _merge_parts(self, parts):
+        # Folded parts hold states in every state column, built ones included.
+        return self._fold(pd.concat(parts, ignore_index=True), self._state_columns(), build=False)
+
+    def _compact(self):
+        if len(self._parts) > 1:
+            self._parts = [self._merge_parts(self._parts)]
+            self._bytes = frame_nbytes(self._parts[0])
+
+    def _spill(self):
+        if not self._parts:
+            return
+        if self._tmp is None:
+            if self.spill_dir:
+                os.makedirs(self.spill_dir, exist_ok=True)
+            self._tmp = tempfile.mkdtemp(prefix="axelar-stream-", dir=self.spill_dir or None)
+        state = pd.concat(self._parts, ignore_index=True)
+        partition = pd.util.hash_pandas_object(state[self.keys], index=False).to_numpy() % self.partitions
+        for number, rows in state.groupby(partition):
+            path = os.path.join(self._tmp, f"part-{number:03d}-run-{self.spills:05d}.parquet")
+            rows.to_parquet(path, index=False)
+            self.spilled_bytes += os.path.getsize(path)
+        self.spills += 1
+        self._parts, self._bytes = [], 0
+
+    def result(self):
+        """The merged aggregate: keys, sums and one state column per sketch, sorted by the keys."""
+        if self._tmp is None:
+            out = self._merge_parts(self._parts) if self._parts else pd.DataFrame(columns=self.keys + self.sums + self._state_columns())
+        else:
+            # Groups never straddle partitions, so each partition merges on its own.
+            self._spill()
+            runs = (sorted(glob.glob(os.path.join(self._tmp, f"part-{number:03d}-*.parquet"))) for number in range(self.partitions))
+            out = pd.concat([self._merge_parts([pd.read_parquet(path) for path in paths]) for paths in runs if paths], ignore_index=True)
+        annotate(stream_spills=self.spills, stream_spilled_bytes=self.spilled_bytes)
+        return out.sort_values(self.keys, ignore_index=True)
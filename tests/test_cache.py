@@ -0,0 +1,114 @@
+"""The in-process range cache: eviction, expiry, background refresh and retries (see cache.py)."""
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from axelar_dashboard import cache
+from axelar_dashboard.cache import RangeCache
+from axelar_dashboard.cancellation import QueryCancelled
+from axelar_dashboard.executor import PRIORITY_LOW
+
+
+class _Executor:
+    """Holds submitted calls until the test runs them."""
+
+    def __init__(self):
+        self.calls = []
+
+    def submit(self, fn, *args, priority, **kwargs):
+        self.calls.append((priority, fn, args))
+
+    def run(self):
+        calls, self.calls = self.calls, []
+        for _, fn, args in calls:
+            fn(*args)
+
+
+@pytest.fixture()
+def executor(monkeypatch):
+    executor = _Executor()
+    monkeypatch.setattr(cache, "get_executor", lambda: executor)
+    return executor
+
+
+def _frame(n):
+    return pd.DataFrame({"value": range(n)})
+
+
+def test_evicts_least_recently_used_by_count():
+    rc = RangeCache(max_entries=2)
+    rc.get("a", lambda: 1, False)
+    rc.get("b", lambda: 2, False)
+    rc.get("a", lambda: pytest.fail("a is cached"), False)
+    rc.get("c", lambda: 3, False)
+    assert rc.get("a", lambda: "reloaded", False) == 1
+    assert rc.get("b", lambda: "reloaded", False) == "reloaded"
+
+
+def test_evicts_least_recently_used_by_bytes():
+    nbytes = cache.frame_nbytes(_frame(1000))
+    rc = RangeCache(max_bytes=2 * nbytes)
+    for key in "abc":
+        rc.get(key, lambda: _frame(1000), False)
+    assert rc.stats()["entries"] == 2
+    assert rc.stats()["bytes"] == 2 * nbytes
+    assert rc.get("a", lambda: "reloaded", False) == "reloaded"
+
+
+def test_settled_ranges_never_expire(executor):
+    rc = RangeCache(open_ttl=0)
+    rc.get("settled", lambda: 1, False)
+    assert rc.get("settled", lambda: pytest.fail("settled ranges do not expire"), False) == 1
+    assert executor.calls == []
+
+
+def test_expired_entry_is_served_while_a_low_priority_refresh_runs(executor):
+    rc = RangeCache(open_ttl=0)
+    rc.get("open", lambda: 1, True)
+    # Expired: the old value is served and one refresh queued, however many readers see it.
+    assert rc.get("open", lambda: 2, True) == 1
+    assert rc.get("open", lambda: 3, True) == 1
+    assert [priority for priority, _, _ in executor.calls] == [PRIORITY_LOW]
+    executor.run()
+    assert rc.get("open", lambda: 4, True) == 2
+    assert rc.stats()["loads"] == 2
+
+
+def test_failed_refresh_keeps_the_stale_value(executor):
+    rc = RangeCache(open_ttl=0)
+    rc.get("open", lambda: 1, True)
+    rc.get("open", lambda: 1 / 0, True)
+    executor.run()
+    assert rc.get("open", lambda: 2, True) == 1
+    assert len(executor.calls) == 1  # the next refresh could be queued again
+
+
+def test_retries_a_cancelled_load():
+    attempts = []
+
+    def load():
+        attempts.append(None)
+        if len(attempts) < 3:
+            raise QueryCancelled("superseded")
+        return "loaded"
+
+    rc = RangeCache()
+    assert rc.get("key", load, False) == "loaded"
+    assert len(attempts) == 3
+
+    with pytest.raises(QueryCancelled):
+        rc.get("other", lambda: (_ for _ in ()).throw(QueryCancelled("superseded")), False)
+
+
+def test_range_cache_hands_out_copies(monkeypatch):
+    monkeypatch.setattr(cache, "_cache", RangeCache())
+    monkeypatch.setattr(cache, "settled_before", lambda: date(2025, 2, 1))
+
+    @cache.range_cache
+    def loader(start_date, end_date):
+        return _frame(3)
+
+    first = loader(date(2025, 1, 1), date(2025, 1, 31))
+    first["value"] = -1
+    pd.testing.assert_frame_equal(loader(date(2025, 1, 1), date(2025, 1, 31)), _frame(3))
@@ -0,0 +1,111 @@
+"""Superseded reruns' loads and fair queueing across sessions (see cancellation.py and executor.py)."""
+import threading
+from contextlib import ExitStack
+
+import pytest
+
+from axelar_dashboard.cancellation import QueryCancelled, Supersession, ticket
+from axelar_dashboard.executor import PRIORITY_HIGH, PRIORITY_LOW, PRIORITY_NORMAL, PriorityExecutor
+
+
+def _interested(stack, supersession, key, session, generation):
+    """Wait on ``key`` for the ticket until ``stack`` closes."""
+    with ticket(session, generation):
+        return stack.enter_context(supersession.interest(key))
+
+
+def test_advance_numbers_generations_across_sessions():
+    supersession = Supersession()
+    first = supersession.advance("a")
+    second = supersession.advance("b")
+    third = supersession.advance("a")
+    assert first < second < third
+
+
+def test_cancels_loads_only_superseded_tickets_wait_for():
+    supersession = Supersession()
+    old = supersession.advance("a")
+    other = supersession.advance("b")
+    hooks = []
+    stack = ExitStack()
+
+    alone = _interested(stack, supersession, "alone", "a", old)
+    shared = _interested(stack, supersession, "shared", "a", old)
+    _interested(stack, supersession, "shared", "b", other)
+    background = _interested(stack, supersession, "background", None, 0)
+    alone.hooks.append(lambda: hooks.append("alone"))
+
+    supersession.advance("a")
+    assert alone.cancelled and hooks == ["alone"]
+    assert not shared.cancelled  # b's current rerun still waits for it
+    assert not background.cancelled  # loads without a ticket are never cancelled
+    assert supersession.cancelled == 1
+
+    # The superseded rerun cannot register interest any more; a new generation starts a fresh load.
+    with pytest.raises(QueryCancelled), ticket("a", old):
+        with supersession.interest("alone"):
+            pass
+    fresh = _interested(stack, supersession, "alone", "a", supersession.advance("a"))
+    assert fresh is not alone and not fresh.cancelled
+
+    stack.close()
+    assert supersession._flights == {}
+
+
+def test_forget_ended_sessions():
+    supersession = Supersession()
+    old = supersession.advance("gone")
+    supersession.advance("here")
+    supersession.forget_ended(lambda session: session == "here")
+    assert "gone" not in supersession._generations and "here" in supersession._generations
+
+    # A forgotten session's tickets are current again, and it never gets an old generation back.
+    with ExitStack() as stack:
+        flight = _interested(stack, supersession, "key", "gone", old)
+        supersession.advance("here")
+        assert not flight.cancelled
+    assert supersession.advance("gone") > old
+
+
+def _run_in_order(submissions):
+    """Submit ``(label, priority, session)`` calls while the single worker is busy; return the order they ran."""
+    executor = PriorityExecutor(max_workers=1)
+    started, release = threading.Event(), threading.Event()
+    order = []
+
+    def block():
+        started.set()
+        release.wait(5)
+
+    executor.submit(block)
+    assert started.wait(5)
+    futures = [
+        executor.submit(order.append, label, priority=priority, session=session)
+        for label, priority, session in submissions
+    ]
+    release.set()
+    for future in futures:
+        future.result(5)
+    return order
+
+
+def test_sessions_take_turns_within_a_priority():
+    order = _run_in_order([
+        ("a1", PRIORITY_NORMAL, "a"),
+        ("a2", PRIORITY_NORMAL, "a"),
+        ("a3", PRIORITY_NORMAL, "a"),
+        ("b1", PRIORITY_NORMAL, "b"),
+        ("c1", PRIORITY_NORMAL, "c"),
+        ("b2", PRIORITY_NORMAL, "b"),
+    ])
+    assert order == ["a1", "b1", "c1", "a2", "b2", "a3"]
+
+
+def test_priority_comes_before_turns():
+    order = _run_in_order([
+        ("a-low", PRIORITY_LOW, "a"),
+        ("a-normal", PRIORITY_NORMAL, "a"),
+        ("b-normal", PRIORITY_NORMAL, "b"),
+        ("b-high", PRIORITY_HIGH, "b"),
+    ])
+    assert order == ["b-high", "b-normal", "a-normal", "a-low"]
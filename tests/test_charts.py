@@ -0,0 +1,55 @@
+"""Downsampling and the process-wide figure cache (see charts.py)."""
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import pytest
+
+from axelar_dashboard import charts
+from axelar_dashboard.charts import cached_figure, lttb, optimize
+
+
+@pytest.mark.parametrize("n, n_out", [(10_000, 1000), (1_001, 1000), (500, 3), (7, 5)])
+def test_lttb_keeps_the_ends_and_at_most_n_out_points(n, n_out):
+    rng = np.random.default_rng(n)
+    x = np.arange(n)
+    y = rng.normal(size=n).cumsum()
+    keep = lttb(x, y, n_out)
+    assert len(keep) == n_out
+    assert keep[0] == 0 and keep[-1] == n - 1
+    assert (np.diff(keep) > 0).all()
+
+
+@pytest.mark.parametrize("n, n_out", [(0, 1000), (1, 1000), (999, 1000), (1000, 1000), (50, 2)])
+def test_lttb_leaves_small_inputs_alone(n, n_out):
+    np.testing.assert_array_equal(lttb(np.arange(n), np.ones(n), n_out), np.arange(n))
+
+
+def test_lttb_keeps_spikes():
+    y = np.zeros(10_000)
+    y[4321] = 100.0
+    assert 4321 in lttb(np.arange(len(y)), y, 100)
+
+
+def test_optimize_downsamples_long_lines():
+    x = pd.date_range("2020-01-01", periods=5_000, freq="h")
+    fig = optimize(go.Figure(go.Scatter(x=x, y=np.sin(np.arange(5_000) / 50), mode="lines")), max_line_points=500)
+    trace = fig.data[0]
+    assert len(trace.x) == 500
+    assert pd.Timestamp(trace.x[0]) == x[0] and pd.Timestamp(trace.x[-1]) == x[-1]
+
+
+def test_cached_figure_builds_once_per_content(monkeypatch):
+    monkeypatch.setattr(charts, "_figures", type(charts._figures)())
+    builds = []
+
+    def build(df, title):
+        builds.append(title)
+        return go.Figure(go.Bar(x=df["x"], y=df["y"]), layout=dict(title=title))
+
+    df = pd.DataFrame({"x": [1, 2, 3], "y": [4, 5, 6]})
+    first = cached_figure("bars", df, build, "Bars")
+    assert isinstance(first, go.Figure)
+    assert cached_figure("bars", df.copy(), build, "Bars") is first
+    cached_figure("bars", df.assign(y=[4, 5, 7]), build, "Bars")
+    cached_figure("bars", df, build, "Other title")
+    assert builds == ["Bars", "Bars", "Other title"]
@@ -0,0 +1,101 @@
+"""Chain-pair totals from the prefix-sum cube against grouping the day rows (see cube.py)."""
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from axelar_dashboard import cube
+from axelar_dashboard.cube import PairCube
+
+FIRST = date(2025, 1, 1)
+DAYS = 60
+SETTLED_BEFORE = FIRST + timedelta(days=DAYS - 5)
+CHAINS = ["ethereum", "osmosis", "arbitrum", None]
+MEASURES = ("VOLUME_USD", "N_PRICED")
+
+
+@pytest.fixture(autouse=True)
+def settled(monkeypatch):
+    monkeypatch.setattr(cube, "settled_before", lambda: SETTLED_BEFORE)
+
+
+def _day(i):
+    return FIRST + timedelta(days=i)
+
+
+def _daily(seed=0):
+    rng = np.random.default_rng(seed)
+    n = 2_000
+    days = rng.integers(0, DAYS, n)
+    days = days[(days % 7 != 3)]  # weekly days without rows
+    df = pd.DataFrame({
+        "DAY": pd.to_datetime([_day(int(i)) for i in days]),
+        "SOURCE_CHAIN": rng.choice(np.array(CHAINS, dtype=object), len(days)),
+        "DESTINATION_CHAIN": rng.choice(np.array(CHAINS, dtype=object), len(days)),
+        "VOLUME_USD": rng.uniform(0, 1_000, len(days)).round(2),
+        "N_PRICED": rng.integers(0, 3, len(days)),
+    })
+    df.loc[df["DAY"] == pd.Timestamp(_day(11)), "N_PRICED"] = 0  # a day without priced rows
+    return df
+
+
+def _rows(daily, first, last):
+    return daily[daily["DAY"].between(pd.Timestamp(_day(first)), pd.Timestamp(_day(last)))]
+
+
+def _expected(daily, first, last):
+    rows = _rows(daily, first, last)
+    rows = rows[rows["N_PRICED"] > 0]
+    grouped = rows.groupby(["SOURCE_CHAIN", "DESTINATION_CHAIN"], dropna=False)[list(MEASURES)].sum()
+    return grouped.reset_index().sort_values(["SOURCE_CHAIN", "DESTINATION_CHAIN"], ignore_index=True)
+
+
+def _totals(pairs, first, last):
+    totals = pairs.totals(_day(first), _day(last))
+    if totals is None:
+        return None
+    totals = totals.astype({"N_PRICED": "int64"})
+    return totals.sort_values(["SOURCE_CHAIN", "DESTINATION_CHAIN"], ignore_index=True)
+
+
+def test_totals_match_groupby_over_random_ranges():
+    daily = _daily()
+    pairs = PairCube(MEASURES, priced="N_PRICED")
+    # Loaded out of order, with gaps, overlapping, and past the settled days.
+    loads = [(20, 29), (0, 9), (25, 40), (50, DAYS - 1)]
+    loaded = set()
+    for first, last in loads:
+        pairs.add(_rows(daily, first, last), _day(first), _day(last))
+        loaded.update(range(first, min(last, DAYS - 6) + 1))
+
+    rng = np.random.default_rng(1)
+    covered = 0
+    for _ in range(300):
+        first, last = sorted(rng.integers(0, DAYS, 2).tolist())
+        totals = _totals(pairs, first, last)
+        if not set(range(first, last + 1)) <= loaded:
+            assert totals is None
+            continue
+        covered += 1
+        pd.testing.assert_frame_equal(totals, _expected(daily, first, last), check_dtype=False, check_exact=False)
+    assert covered > 20
+
+
+def test_days_without_priced_rows_are_loaded():
+    daily = _daily()
+    pairs = PairCube(MEASURES, priced="N_PRICED")
+    pairs.add(_rows(daily, 10, 12), _day(10), _day(12))
+    assert _totals(pairs, 11, 11).empty
+    assert _totals(pairs, 10, 17) is None
+    pairs.add(_rows(daily, 17, 17), _day(17), _day(17))  # a day without rows
+    pairs.add(_rows(daily, 13, 16), _day(13), _day(16))
+    pd.testing.assert_frame_equal(_totals(pairs, 10, 17), _expected(daily, 10, 17), check_dtype=False, check_exact=False)
+
+
+def test_adding_a_range_twice_does_not_double_count():
+    daily = _daily()
+    pairs = PairCube(MEASURES, priced="N_PRICED")
+    pairs.add(_rows(daily, 0, 20), _day(0), _day(20))
+    pairs.add(_rows(daily, 5, 30), _day(5), _day(30))
+    pd.testing.assert_frame_equal(_totals(pairs, 0, 30), _expected(daily, 0, 30), check_dtype=False, check_exact=False)
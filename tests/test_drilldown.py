@@ -0,0 +1,117 @@
+"""Keyset paging of drill-down rows against the local DuckDB stand-in (see localdb.py)."""
+from concurrent.futures import Future
+from datetime import date
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("duckdb")
+
+from axelar_dashboard import drilldown  # noqa: E402
+from axelar_dashboard.benchmark import build_warehouse  # noqa: E402
+from axelar_dashboard.drilldown import Selection, SessionPages, build_page_query, fetch_page  # noqa: E402
+from axelar_dashboard.localdb import DuckDBConnection  # noqa: E402
+
+SELECTION = Selection("squid", date(2025, 1, 2), date(2025, 1, 5))
+
+
+class _Backend:
+    def __init__(self, cursor):
+        self.cursor = cursor
+
+    def read_frame(self, query, params=None):
+        return self.cursor.execute(query, params).fetch_arrow_all().to_pandas()
+
+
+@pytest.fixture()
+def cursor(tmp_path, monkeypatch):
+    build_warehouse(tmp_path / "axelar.duckdb", date(2025, 1, 1), date(2025, 1, 7), scale=0.05)
+    conn = DuckDBConnection(str(tmp_path / "axelar.duckdb"), read_only=False)
+    cur = conn.cursor()
+    # Whole-hour timestamps, so many rows share one and pages break inside runs of equal timestamps.
+    for table in ("axelscan.fact_transfers", "axelscan.fact_gmp"):
+        cur.execute(f"UPDATE {table} SET created_at = DATE_TRUNC('hour', created_at)")
+    monkeypatch.setattr(drilldown, "backend_for", lambda start_date, end_date: _Backend(cur))
+    yield cur
+    conn.close()
+
+
+def _all_pages(selection, limit):
+    pages, after = [], None
+    while True:
+        rows, after = fetch_page(selection, after, limit)
+        assert len(rows) <= limit
+        pages.append(rows)
+        if after is None:
+            return pages
+
+
+def test_build_page_query_reads_one_row_past_the_page():
+    query, _ = build_page_query(SELECTION, limit=25)
+    assert query.endswith("LIMIT 26")
+
+
+def test_pages_cover_every_row_once(cursor):
+    everything, after = fetch_page(SELECTION, limit=100_000)
+    assert after is None
+    assert everything["CREATED_AT"].duplicated().any()
+    assert everything["AMOUNT_USD"].notna().all()
+
+    pages = _all_pages(SELECTION, limit=7)
+    assert all(len(rows) == 7 for rows in pages[:-1])
+    paged = pd.concat(pages, ignore_index=True)
+    assert not paged["ID"].duplicated().any()
+    pd.testing.assert_frame_equal(paged, everything)
+
+
+def test_last_page_has_no_cursor(cursor):
+    n = len(fetch_page(SELECTION, limit=100_000)[0])
+    assert fetch_page(SELECTION, limit=n)[1] is None
+    assert fetch_page(SELECTION, limit=n - 1)[1] is not None
+
+
+def test_pair_filter_pages(cursor):
+    everything, _ = fetch_page(SELECTION, limit=100_000)
+    pair = everything[["SOURCE_CHAIN", "DESTINATION_CHAIN"]].value_counts().index[0]
+    selection = Selection("squid", SELECTION.start_date, SELECTION.end_date,
+                          (("destination_chain", pair[1]), ("source_chain", pair[0])))
+    paged = pd.concat(_all_pages(selection, limit=3), ignore_index=True)
+    expected = everything[(everything["SOURCE_CHAIN"] == pair[0]) & (everything["DESTINATION_CHAIN"] == pair[1])]
+    pd.testing.assert_frame_equal(paged, expected.reset_index(drop=True))
+
+
+def test_rejects_unknown_filters():
+    with pytest.raises(ValueError):
+        build_page_query(Selection("squid", SELECTION.start_date, SELECTION.end_date, (("status", "Failed"),)))
+
+
+class _Executor:
+    """Runs each call right away."""
+
+    def submit(self, fn, *args, priority, session):
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+
+def test_session_pages_keep_at_most_max_rows(monkeypatch):
+    fetched = []
+
+    def fake_fetch(selection, after):
+        fetched.append(after)
+        return pd.DataFrame({"ID": range(10)}), (after or 0) + 1
+
+    monkeypatch.setattr(drilldown, "get_executor", lambda: _Executor())
+    monkeypatch.setattr(drilldown, "fetch_page", fake_fetch)
+    pages = SessionPages(max_rows=25)
+    for after in (None, 1, 2):
+        pages.page(SELECTION, after)
+    pages.page(SELECTION, 1)  # most recently used again
+    pages.page(SELECTION, 3)
+    assert fetched == [None, 1, 2, 3]
+
+    # Only the 2 most recently used pages fit in 25 rows: 3 and 1.
+    pages.page(SELECTION, 1)
+    assert fetched == [None, 1, 2, 3]
+    pages.page(SELECTION, 2)
+    assert fetched == [None, 1, 2, 3, 2]
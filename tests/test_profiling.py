@@ -0,0 +1,70 @@
+"""Which profile spans land in, for page reruns and fragment reruns (see profiling.py)."""
+import contextvars
+import json
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+from axelar_dashboard import profiling
+from axelar_dashboard.profiling import span, start_fragment_profile, start_profile
+
+
+@pytest.fixture()
+def logged(monkeypatch):
+    records = []
+
+    class Handler(logging.Handler):
+        def emit(self, record):
+            records.append(json.loads(record.getMessage()))
+
+    handler = Handler()
+    profiling.logger.addHandler(handler)
+    monkeypatch.setattr(profiling.logger, "level", logging.INFO)
+    yield records
+    profiling.logger.removeHandler(handler)
+
+
+def _rerun(monkeypatch, fragment_ids):
+    ctx = SimpleNamespace(fragment_ids_this_run=fragment_ids)
+    monkeypatch.setattr(profiling, "get_script_run_ctx", lambda suppress_warning=False: ctx)
+
+
+def _in_script_thread(fn):
+    # The script thread keeps one context across reruns.
+    return contextvars.copy_context().run(fn)
+
+
+def test_page_rerun_keeps_the_page_profile(monkeypatch, logged):
+    _rerun(monkeypatch, None)
+
+    def run():
+        page = start_profile()
+        assert start_fragment_profile() is page
+        with span("KPI row", "chart", section="core"):
+            pass
+        return page
+
+    page = _in_script_thread(run)
+    assert [record["name"] for record in page.records] == ["KPI row"]
+    assert [(record["run_id"], "parent_run_id" in record) for record in logged] == [(page.run_id, False)]
+
+
+def test_fragment_rerun_starts_a_child_profile(monkeypatch, logged):
+    def run():
+        _rerun(monkeypatch, None)
+        page = start_profile()
+        with span("KPI row", "chart", section="core"):
+            pass
+        _rerun(monkeypatch, ["core-fragment"])
+        child = start_fragment_profile()
+        with span("KPI row", "chart", section="core"):
+            pass
+        return page, child
+
+    page, child = _in_script_thread(run)
+    assert child is not page and child.parent_run_id == page.run_id
+    assert len(page.records) == len(child.records) == 1
+    assert [(record["run_id"], record.get("parent_run_id")) for record in logged] == [
+        (page.run_id, None), (child.run_id, page.run_id),
+    ]
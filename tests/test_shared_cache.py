@@ -0,0 +1,110 @@
+"""The cross-replica result cache and its stores (see shared_cache.py)."""
+import time
+from datetime import date
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from axelar_dashboard import shared_cache
+from axelar_dashboard.shared_cache import DirectoryStore, MemoryStore, SharedResultCache
+
+QUERY = "SELECT *\n  FROM axelar.core.fact_transactions WHERE note = 'a  b'"
+
+
+@pytest.fixture(autouse=True)
+def settled(monkeypatch):
+    monkeypatch.setattr(shared_cache, "settled_before", lambda: date(2025, 3, 1))
+
+
+@pytest.fixture()
+def clock(monkeypatch):
+    now = [time.time()]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    return now
+
+
+class _RecordingStore(MemoryStore):
+    def __init__(self):
+        super().__init__()
+        self.ttls = []
+
+    def set(self, key, value, ex=None):
+        self.ttls.append(ex)
+        super().set(key, value, ex=ex)
+
+
+def _table():
+    df = pd.DataFrame({
+        "DAY": pd.to_datetime(["2025-01-01", "2025-01-02", None]),
+        "SOURCE_CHAIN": pd.Categorical(["ethereum", None, "osmosis"]),
+        "N_TXNS": pd.array([1, 2, 3], dtype="int16"),
+        "VOLUME_USD": [1.5, None, 2.25],
+        "USERS_HLL": ['{"version":4}', None, "{}"],
+        "PRICED": [True, False, True],
+    })
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+@pytest.mark.parametrize("store", ["memory", "directory"])
+def test_round_trip_preserves_types(tmp_path, store):
+    cache = SharedResultCache(MemoryStore() if store == "memory" else DirectoryStore(str(tmp_path)))
+    table = _table()
+    cache.put(QUERY, {"end": "2020-01-01"}, table)
+    cached = cache.get(QUERY, {"end": "2020-01-01"})
+    assert cached.schema.equals(table.schema, check_metadata=True)
+    assert cached.equals(table)
+    pd.testing.assert_frame_equal(cached.to_pandas(), table.to_pandas())
+    assert cache.get(QUERY, {"end": "2020-01-02"}) is None
+
+
+def test_keys_ignore_formatting_outside_literals():
+    cache = SharedResultCache(MemoryStore())
+    assert cache.key(QUERY) == cache.key("SELECT * FROM axelar.core.fact_transactions   WHERE note = 'a  b'")
+    assert cache.key(QUERY) != cache.key(QUERY.replace("'a  b'", "'a b'"))
+
+
+def test_results_reaching_unsettled_days_get_the_short_ttl():
+    store = _RecordingStore()
+    cache = SharedResultCache(store, open_ttl=60, closed_ttl=3600)
+    for params in ({"start": "2025-01-01", "end": "2025-03-01"}, {"end": "2025-03-02"}, None):
+        cache.put(QUERY, params, _table())
+    assert store.ttls == [3600, 60, 60]
+
+
+def test_directory_store_expiry(tmp_path, clock):
+    store = DirectoryStore(str(tmp_path))
+    store.set("open", b"1", ex=60)
+    store.set("closed", b"2")
+    assert store.get("open") == b"1" and store.get("closed") == b"2"
+    clock[0] += 61
+    assert store.get("open") is None
+    assert store.get("closed") == b"2"
+    assert store.get("missing") is None
+
+
+def test_directory_store_prune(tmp_path, clock):
+    store = DirectoryStore(str(tmp_path), prune_every=3)
+    (tmp_path / "unrelated.txt").write_text("kept")
+    store.set("a", b"1", ex=10)
+    store.set("b", b"2", ex=100)
+    clock[0] += 50
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["a.arrows", "b.arrows", "unrelated.txt"]
+    store.set("c", b"3")  # every third write prunes
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["b.arrows", "c.arrows", "unrelated.txt"]
+    clock[0] += 100
+    store.prune()
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["c.arrows", "unrelated.txt"]
+
+
+def test_unreachable_store_is_a_miss():
+    class Broken:
+        def get(self, key):
+            raise ConnectionError("down")
+
+        def set(self, key, value, ex=None):
+            raise ConnectionError("down")
+
+    cache = SharedResultCache(Broken())
+    cache.put(QUERY, None, _table())
+    assert cache.get(QUERY) is None
@@ -0,0 +1,75 @@
+"""Coalescing concurrent calls for one key (see singleflight.py)."""
+import threading
+import time
+
+import pytest
+
+from axelar_dashboard.singleflight import SingleFlight
+
+WAITERS = 8
+
+
+def _wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+def _race(flight, fn):
+    """Run ``fn`` under one key from a leader and WAITERS callers that arrive while it runs."""
+    release = threading.Event()
+    calls = []
+    outcomes = [None] * (WAITERS + 1)
+
+    def leader_fn():
+        calls.append(None)
+        release.wait(5)
+        return fn()
+
+    def call(i):
+        try:
+            outcomes[i] = flight.do("key", leader_fn if i == 0 else lambda: pytest.fail("ran twice"))
+        except Exception as exc:
+            outcomes[i] = exc
+
+    threads = [threading.Thread(target=call, args=(0,))]
+    threads[0].start()
+    _wait_for(lambda: calls)
+    threads += [threading.Thread(target=call, args=(i,)) for i in range(1, WAITERS + 1)]
+    for thread in threads[1:]:
+        thread.start()
+    _wait_for(lambda: flight.stats()["coalesced"] == WAITERS)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    assert len(calls) == 1
+    return outcomes
+
+
+def test_waiters_share_the_leaders_result():
+    flight = SingleFlight()
+    result = object()
+    outcomes = _race(flight, lambda: result)
+    assert outcomes[0] == (result, False)
+    assert all(outcome == (result, True) for outcome in outcomes[1:])
+    assert flight.stats() == {"executed": 1, "coalesced": WAITERS, "in_flight": 0}
+
+
+def test_waiters_see_the_leaders_exception():
+    flight = SingleFlight()
+    error = RuntimeError("warehouse unavailable")
+
+    def fail():
+        raise error
+
+    outcomes = _race(flight, fail)
+    assert all(outcome is error for outcome in outcomes)
+    assert flight.stats() == {"executed": 1, "coalesced": WAITERS, "in_flight": 0}
+
+
+def test_later_calls_run_again():
+    flight = SingleFlight()
+    assert flight.do("key", lambda: 1) == (1, False)
+    assert flight.do("key", lambda: 2) == (2, False)
+    assert flight.stats() == {"executed": 2, "coalesced": 0, "in_flight": 0}
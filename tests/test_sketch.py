@@ -0,0 +1,59 @@
+"""HLL_EXPORT states built, exported and merged locally (see sketch.py)."""
+import json
+
+import numpy as np
+import pytest
+
+from axelar_dashboard.sketch import HllSketch, build_states, distinct_count, merge_states
+
+
+def _sketch(values):
+    sketch = HllSketch()
+    for value in values:
+        sketch.add(value)
+    return sketch
+
+
+@pytest.mark.parametrize("n, layout", [(100, "sparse"), (20_000, "dense")])
+def test_export_round_trip(n, layout):
+    sketch = _sketch(f"axelar{i}" for i in range(n))
+    state = sketch.to_export()
+    assert layout in json.loads(state)
+    restored = HllSketch.from_export(state)
+    assert restored.precision == sketch.precision
+    np.testing.assert_array_equal(restored.registers, sketch.registers)
+    assert restored.to_export() == state
+
+
+def test_build_states_matches_add():
+    values = [f"axelar{i}" for i in range(3_000)] + [None]
+    groups = np.arange(len(values)) % 3
+    states = build_states(groups, values, 3)
+    for group, state in enumerate(states):
+        expected = _sketch(value for value, g in zip(values, groups) if g == group and value is not None)
+        np.testing.assert_array_equal(HllSketch.from_export(state).registers, expected.registers)
+
+
+def test_merge_is_associative_and_equals_the_union():
+    a, b, c = (_sketch(f"axelar{i}" for i in range(start, start + 5_000)) for start in (0, 3_000, 6_000))
+    left = merge_states([merge_states([a.to_export(), b.to_export()]).to_export(), c.to_export()])
+    right = merge_states([a.to_export(), merge_states([b.to_export(), c.to_export()]).to_export()])
+    union = _sketch(f"axelar{i}" for i in range(11_000))
+    np.testing.assert_array_equal(left.registers, right.registers)
+    np.testing.assert_array_equal(left.registers, union.registers)
+    # Missing states (days without rows) are skipped.
+    assert distinct_count([a.to_export(), None, float("nan")]) == a.estimate()
+    assert distinct_count([]) == 0
+
+
+def test_merge_rejects_other_precisions():
+    with pytest.raises(ValueError):
+        HllSketch(12).merge(HllSketch(10))
+
+
+@pytest.mark.parametrize("n", [1_000, 10_000, 100_000])
+def test_estimate_error(n):
+    # Standard error at precision 12 is 1.04 / sqrt(4096), about 1.6%; allow three of them.
+    values = [f"axelar1{i:039d}" for i in range(n)]
+    estimate = distinct_count(build_states(np.zeros(n, dtype=np.int64), values, 1))
+    assert abs(estimate - n) <= 0.05 * n
@@ -0,0 +1,78 @@
+"""Staging DDL, refresh and reads against the local DuckDB stand-in (see localdb.py)."""
+from datetime import date, datetime
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("duckdb")
+
+from axelar_dashboard import staging  # noqa: E402
+from axelar_dashboard.benchmark import build_warehouse  # noqa: E402
+from axelar_dashboard.localdb import DuckDBConnection  # noqa: E402
+from axelar_dashboard.queries import SATELLITE_DAILY, SQUID_DAILY, build_daily_query  # noqa: E402
+
+SCHEMA = "staging"
+SINCE = datetime(2025, 1, 10)
+UNTIL = datetime(2025, 2, 1)
+
+
+@pytest.fixture()
+def cursor(tmp_path):
+    build_warehouse(tmp_path / "axelar.duckdb", date(2025, 1, 1), date(2025, 1, 31), scale=0.05)
+    conn = DuckDBConnection(str(tmp_path / "axelar.duckdb"), read_only=False)
+    cur = conn.cursor()
+    cur.execute(f"CREATE SCHEMA {SCHEMA}")
+    yield cur
+    conn.close()
+
+
+def _provision(cur, since=SINCE, until=UNTIL):
+    staging.provision(cur.execute, lambda sql: cur.execute(sql).fetchall(), SCHEMA, since, until=until)
+
+
+def _read(cur, query, params):
+    return cur.execute(query, params).fetch_arrow_all().to_pandas()
+
+
+def _daily(cur, spec, start_date, end_date, facts=None):
+    query, params = build_daily_query(spec, start_date, end_date, facts=facts)
+    keys = ["DAY", *(alias for alias, _ in spec.dimensions)]
+    columns = keys + [alias for alias, _ in spec.metrics if alias != "USERS_HLL"]
+    return _read(cur, query, params)[columns].sort_values(keys, ignore_index=True)
+
+
+def test_refresh_records_span(cursor):
+    _provision(cursor)
+    state = dict((name, (first, last)) for name, first, last in cursor.execute(
+        f"SELECT table_name, refreshed_from, refreshed_through FROM {SCHEMA}.{staging.STATE_TABLE}"
+    ).fetchall())
+    assert state == {table.name: (SINCE, UNTIL) for table in staging.TABLES}
+
+    # An incremental refresh keeps the lower bound and does not duplicate the overlap.
+    before = cursor.execute(f"SELECT COUNT(*) FROM {SCHEMA}.SQUID_TRANSFERS").fetchall()
+    _provision(cursor)
+    assert cursor.execute(f"SELECT COUNT(*) FROM {SCHEMA}.SQUID_TRANSFERS").fetchall() == before
+    assert cursor.execute(
+        f"SELECT refreshed_from FROM {SCHEMA}.{staging.STATE_TABLE} WHERE table_name = 'SQUID_TRANSFERS'"
+    ).fetchall() == [(SINCE,)]
+
+
+@pytest.mark.parametrize("spec, build", [(SQUID_DAILY, staging._staged_squid), (SATELLITE_DAILY, staging._staged_satellite)])
+def test_staged_reads_match_raw(cursor, spec, build):
+    _provision(cursor)
+    start_date, end_date = date(2025, 1, 12), date(2025, 1, 25)
+    staged = _daily(cursor, spec, start_date, end_date, facts=build(SCHEMA))
+    raw = _daily(cursor, spec, start_date, end_date)
+    assert len(raw)
+    pd.testing.assert_frame_equal(staged, raw, check_dtype=False)
+
+
+def test_facts_for_falls_back_outside_the_staged_span(cursor, monkeypatch):
+    _provision(cursor)
+    monkeypatch.setattr(staging, "_schema", lambda: SCHEMA)
+    monkeypatch.setattr(staging, "read_frame", lambda query, params=None: _read(cursor, query, params))
+    monkeypatch.setattr(staging, "_state", {"loaded_at": None, "spans": {}})
+
+    assert staging.facts_for(SQUID_DAILY, date(2025, 1, 10), date(2025, 1, 31)) is not None
+    assert staging.facts_for(SQUID_DAILY, date(2025, 1, 9), date(2025, 1, 31)) is None  # before --since
+    assert staging.facts_for(SQUID_DAILY, date(2025, 1, 10), date(2025, 2, 1)) is None  # past the watermark
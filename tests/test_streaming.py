@@ -0,0 +1,62 @@
+"""Folding windows of day rows within a memory ceiling, spilled or not (see streaming.py)."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from axelar_dashboard.sketch import HllSketch, build_states
+from axelar_dashboard.streaming import StreamingAggregate
+
+KEYS = ["DAY", "SOURCE_CHAIN", "DESTINATION_CHAIN"]
+SUMS = ["N_TXNS", "VOLUME_USD"]
+
+
+def _rows(seed=0, n=6_000):
+    rng = np.random.default_rng(seed)
+    chains = np.array(["ethereum", "osmosis", "arbitrum", None], dtype=object)
+    df = pd.DataFrame({
+        "DAY": pd.Timestamp("2025-01-01") + pd.to_timedelta(np.sort(rng.integers(0, 90, n)), unit="D"),
+        "SOURCE_CHAIN": rng.choice(chains, n),
+        "DESTINATION_CHAIN": rng.choice(chains, n),
+        "SENDER": rng.integers(0, 800, n).astype(str),
+        "N_TXNS": rng.integers(1, 5, n).astype(np.int8),
+        "VOLUME_USD": rng.uniform(0, 100, n),
+    })
+    df.loc[df.index % 10 == 0, "VOLUME_USD"] = np.nan
+    return df
+
+
+def _expected(df):
+    grouped = df.groupby(KEYS, dropna=False, sort=False)
+    out = grouped[SUMS].sum(min_count=1).astype({"N_TXNS": "int64"})
+    out["USERS_HLL"] = build_states(grouped.ngroup().to_numpy(), df["SENDER"], grouped.ngroups)
+    return out.reset_index().sort_values(KEYS, ignore_index=True)
+
+
+def _fold(df, memory_limit, spill_dir):
+    rollup = StreamingAggregate(KEYS, sums=SUMS, build_sketches={"USERS_HLL": "SENDER"},
+                                memory_limit=memory_limit, spill_dir=str(spill_dir), partitions=4)
+    with rollup:
+        for _, window in df.groupby(df["DAY"].dt.to_period("M")):
+            rollup.add(window)
+        return rollup.result(), rollup.spills
+
+
+def _assert_matches(result, expected):
+    pd.testing.assert_frame_equal(result[KEYS + SUMS], expected[KEYS + SUMS], check_dtype=False)
+    for got, want in zip(result["USERS_HLL"], expected["USERS_HLL"]):
+        np.testing.assert_array_equal(HllSketch.from_export(got).registers, HllSketch.from_export(want).registers)
+
+
+@pytest.mark.parametrize("memory_limit", [1 << 40, 1])
+def test_result_matches_grouping_everything(tmp_path, memory_limit):
+    df = _rows()
+    result, spills = _fold(df, memory_limit, tmp_path)
+    assert (spills > 0) == (memory_limit == 1)
+    _assert_matches(result, _expected(df))
+    assert list(tmp_path.iterdir()) == []  # spill runs are removed on close
+
+
+def test_empty_input(tmp_path):
+    result, spills = _fold(_rows().iloc[0:0], 1, tmp_path)
+    assert spills == 0 and result.empty
+    assert list(result.columns) == KEYS + SUMS + ["USERS_HLL"]